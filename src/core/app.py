@@ -6,8 +6,10 @@ import os
 import re
 import shutil
 from aiogram import Bot, Dispatcher
+from aiogram.client.session.aiohttp import AiohttpSession
 from aiogram.fsm.storage.memory import MemoryStorage
-from openai import AsyncOpenAI
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
 from dotenv import load_dotenv
 
 # Load environment variables (needed for critical secrets)
@@ -69,18 +71,31 @@ if not shutil.which("ffmpeg"):
 # Initialize FSM storage
 storage = MemoryStorage()
 
+# HTTP session for the Bot API: keep a pool of warm connections to
+# api.telegram.org so concurrent sends reuse TLS instead of reconnecting
+session = AiohttpSession(limit=config.telegram.connection_limit)
+
 # Initialize global objects using config values
-bot = Bot(token=TELEGRAM_BOT_TOKEN)
+bot = Bot(token=TELEGRAM_BOT_TOKEN, session=session)
 dp = Dispatcher(storage=storage)
+# One pooled HTTP client shared by chat, TTS and Whisper calls; idle
+# connections stay open well past httpx's 5s default so bursts skip TLS setup
 openai_client = AsyncOpenAI(
     api_key=OPENAI_API_KEY,
     timeout=config.openai.timeout_seconds,
-    max_retries=config.openai.max_retries
+    max_retries=config.openai.max_retries,
+    http_client=DefaultAsyncHttpxClient(
+        limits=httpx.Limits(
+            max_connections=config.openai.connection_limit,
+            max_keepalive_connections=config.openai.keepalive_connections,
+            keepalive_expiry=config.openai.keepalive_timeout,
+        )
+    ),
 )
 
 # Initialize database manager
 from ..storage.database import DatabaseManager
-db = DatabaseManager(config.database.path)
+db = DatabaseManager(config.database.path, config.database.pool_size)
 
 # Cached bot info (populated on first call to get_bot_info())
 _bot_info = None
@@ -2,27 +2,76 @@
 Centralized cache management for translations and TTS
 
 Features:
-- Translation cache: LRU with 24h TTL, 2000 entries
+- Translation cache: adaptive per-entry TTL (24h-48h by hit count), bounded by
+  total cached characters
 - TTS cache: Persistent file-based with automatic cleanup
 - Text normalization for better cache hit rates
 - Thread-safe statistics tracking
 """
+import asyncio
 import hashlib
 import logging
+import math
+import os
 import shutil
 import threading
 import unicodedata
 from pathlib import Path
-from typing import Optional, Dict, Any
-from cachetools import TTLCache
+from typing import Optional, Dict, Any, NamedTuple, Set, Tuple
+from cachetools import LRUCache, TLRUCache, TTLCache
 
 logger = logging.getLogger(__name__)
 
+# Translation cache budget in characters of cached text rather than entries,
+# so a few long messages translated into many languages cannot grow RSS
+# unbounded. Each entry is also charged a fixed overhead for the key/dict.
+TRANSLATION_CACHE_MAX_CHARS = 8_000_000
+TRANSLATION_ENTRY_OVERHEAD = 64
+
+
+# Adaptive TTL: an entry lives BASE * (1 + log2(hits + 1)) seconds from its
+# last hit, capped at BASE * MAX_FACTOR, so common phrases outlive one-offs.
+# New entries start at hits=1, i.e. 24 hours.
+TRANSLATION_BASE_TTL = 12 * 3600  # 12 hours
+TRANSLATION_TTL_MAX_FACTOR = 4    # 48 hours
+TRANSLATION_INITIAL_HITS = 1
+
+
+class CachedTranslation(NamedTuple):
+    """Translation cache value with its hit count"""
+    text: str
+    hits: int = TRANSLATION_INITIAL_HITS
+
+
+def _translation_entry_size(entry: CachedTranslation) -> int:
+    """Approximate size of a cached translation, in characters"""
+    return TRANSLATION_ENTRY_OVERHEAD + len(entry.text)
+
+
+def _translation_ttl(hits: int) -> float:
+    """Lifetime in seconds of a translation entry with the given hit count"""
+    factor = min(TRANSLATION_TTL_MAX_FACTOR, 1 + math.log2(hits + 1))
+    return TRANSLATION_BASE_TTL * factor
+
+
+def _translation_ttu(key, entry: CachedTranslation, now: float) -> float:
+    """Expiry time for a translation entry, growing with its hit count"""
+    return now + _translation_ttl(entry.hits)
+
+
 # Global caches with improved settings
-# Translation cache: 24 hours TTL, 2000 entries (increased from 1000)
-translation_cache = TTLCache(maxsize=2000, ttl=86400)  # 24 hours
+translation_cache = TLRUCache(
+    maxsize=TRANSLATION_CACHE_MAX_CHARS,
+    ttu=_translation_ttu,
+    getsizeof=_translation_entry_size,
+)
 tts_cache = TTLCache(maxsize=500, ttl=3600)  # 1 hour
 
+# Translation cache keys of recently translated messages, by (chat_id,
+# message_id), so an edited message can evict its pre-edit translations
+EDITED_MESSAGE_TRACK_SIZE = 1000
+message_translation_keys = LRUCache(maxsize=EDITED_MESSAGE_TRACK_SIZE)
+
 # Thread lock for cache statistics
 _stats_lock = threading.Lock()
 
@@ -56,6 +105,82 @@ def normalize_text_for_cache(text: str) -> str:
     return text
 
 
+# Texts shorter than this are used in cache keys as-is; longer ones are hashed
+TRANSLATION_KEY_INLINE_MAX = 256
+
+
+def _compact_key_part(text: str):
+    """Keep short strings as-is, digest long ones to bound key size"""
+    if len(text) < TRANSLATION_KEY_INLINE_MAX:
+        return text
+    return hashlib.blake2b(text.encode(), digest_size=16).digest()
+
+
+def make_translation_cache_key(normalized_text: str, source_lang: str,
+                               context: Optional[str], style: str) -> tuple:
+    """Build the base translation cache key (without the target language).
+
+    Entries are stored per target language under ``base_key + (lang,)`` so a
+    request for a different mix of languages reuses the ones already cached.
+    A tuple key is hashed by the dict itself, so short texts (the common case)
+    skip the encode + cryptographic hash round-trip entirely.
+    """
+    return (
+        _compact_key_part(normalized_text),
+        source_lang,
+        _compact_key_part(context) if context else "",
+        style,
+    )
+
+
+def get_cached_translations(cache, base_key: tuple, target_langs) -> Tuple[Dict[str, str], Set[str]]:
+    """Look up each target language individually.
+
+    Returns:
+        Tuple of (cached translations, target languages still missing)
+    """
+    translations: Dict[str, str] = {}
+    missing: Set[str] = set()
+    for lang in target_langs:
+        key = base_key + (lang,)
+        entry = cache.get(key)
+        if entry is None:
+            missing.add(lang)
+        else:
+            translations[lang] = entry.text
+            # Re-insert so the expiry is recomputed from this hit
+            cache[key] = CachedTranslation(entry.text, entry.hits + 1)
+    return translations, missing
+
+
+def store_translations(cache, base_key: tuple, translations: Dict[str, str]):
+    """Store translations under their per-language cache keys"""
+    for lang, translation in translations.items():
+        cache[base_key + (lang,)] = CachedTranslation(translation, TRANSLATION_INITIAL_HITS)
+
+
+def remember_message_translation(chat_id: int, message_id: int, base_key: tuple, langs):
+    """Record which translation cache entries a message produced"""
+    message_translation_keys[(chat_id, message_id)] = (base_key, frozenset(langs))
+
+
+def forget_message_translation(chat_id: int, message_id: int) -> int:
+    """Evict the cached translations of a message's previous text.
+
+    Returns:
+        Number of translation cache entries removed
+    """
+    tracked = message_translation_keys.pop((chat_id, message_id), None)
+    if tracked is None:
+        return 0
+    base_key, langs = tracked
+    removed = 0
+    for lang in langs:
+        if translation_cache.pop(base_key + (lang,), None) is not None:
+            removed += 1
+    return removed
+
+
 def get_cache_stats() -> Dict[str, Any]:
     """Get cache statistics for monitoring (thread-safe).
 
@@ -72,8 +197,10 @@ def get_cache_stats() -> Dict[str, Any]:
                 "misses": cache_stats["translation_misses"],
                 "hit_rate": cache_stats["translation_hits"] / total_translation if total_translation > 0 else 0,
                 "size": len(translation_cache),
+                "chars": translation_cache.currsize,
                 "maxsize": translation_cache.maxsize,
-                "ttl": translation_cache.ttl
+                "ttl": _translation_ttl(TRANSLATION_INITIAL_HITS),
+                "ttl_max": TRANSLATION_BASE_TTL * TRANSLATION_TTL_MAX_FACTOR
             },
             "tts": {
                 "hits": cache_stats["tts_hits"],
@@ -98,26 +225,43 @@ def increment_cache_stat(cache_type: str, hit: bool):
             cache_stats[key] += 1
 
 
+# When over budget, evict least recently used TTS files down to this fraction
+TTS_CACHE_LOW_WATERMARK = 0.9
+
+
 class PersistentTTSCache:
-    """Persistent file-based TTS cache"""
+    """Persistent file-based TTS cache.
 
-    def __init__(self, cache_dir: Optional[Path] = None):
-        if cache_dir is None:
-            # Use data directory relative to project root
+    Bounded by total bytes: file mtime serves as the LRU clock (hits refresh
+    it), and the oldest files are evicted once the budget is exceeded.
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None, max_bytes: Optional[int] = None):
+        if cache_dir is None or max_bytes is None:
             from .config import get_config
             config = get_config()
-            cache_dir = Path(config.database.path).parent / "cache" / "tts"
+            if cache_dir is None:
+                # Use data directory relative to project root
+                cache_dir = Path(config.database.path).parent / "cache" / "tts"
+            if max_bytes is None:
+                max_bytes = config.tts.cache_max_mb * 1024 * 1024
 
         self.cache_dir = cache_dir
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        # Total size of cached files, measured on first write
+        self._total_bytes: Optional[int] = None
+        # In-flight background measure/evict walk, shared by concurrent inserts
+        self._evict_task: Optional[asyncio.Task] = None
 
     def _get_cache_key(self, text: str) -> str:
         """Generate cache key from text + current voice + model so changing
         TTS settings produces new cache entries instead of serving stale audio."""
         from .config import get_config
         cfg = get_config()
-        key = f"{text}:{cfg.tts.voice}:{cfg.tts.model}"
-        return hashlib.md5(key.encode()).hexdigest()
+        # NUL-separated so no text/voice/model combination can collide by concatenation
+        payload = b"\x00".join((text.encode(), cfg.tts.voice.encode(), cfg.tts.model.encode()))
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
 
     def _get_cache_path(self, cache_key: str) -> Path:
         """Get file path for cache key"""
@@ -128,10 +272,13 @@ class PersistentTTSCache:
         cache_key = self._get_cache_key(text)
         cache_path = self._get_cache_path(cache_key)
 
-        if cache_path.exists():
-            logger.info(f"TTS cache hit for: {text[:50]}...")
-            return cache_path
-        return None
+        try:
+            # Refresh mtime so age-based cleanup never removes audio in active use
+            os.utime(cache_path)
+        except FileNotFoundError:
+            return None
+        logger.info(f"TTS cache hit for: {text[:50]}...")
+        return cache_path
 
     def set(self, text: str, audio_data: bytes) -> Path:
         """Save audio data to cache"""
@@ -142,8 +289,93 @@ class PersistentTTSCache:
             f.write(audio_data)
 
         logger.info(f"TTS cached for: {text[:50]}...")
+        self._track_added(len(audio_data))
+        return cache_path
+
+    def new_part_path(self) -> Path:
+        """Unique scratch path for an entry being written (same filesystem as the cache)"""
+        return self.cache_dir / f"part_{os.urandom(8).hex()}.tmp"
+
+    def set_from_path(self, text: str, part_path: Path) -> Path:
+        """Atomically move an already written audio file into the cache"""
+        cache_key = self._get_cache_key(text)
+        cache_path = self._get_cache_path(cache_key)
+
+        os.replace(part_path, cache_path)
+
+        logger.info(f"TTS cached for: {text[:50]}...")
+        self._track_added(cache_path.stat().st_size)
         return cache_path
 
+    def _track_added(self, size: int):
+        """Account for a new entry and evict old files when over budget.
+
+        The directory walk and unlinks run in a worker thread; concurrent
+        inserts share the one in flight.
+        """
+        if self._total_bytes is not None:
+            self._total_bytes += size
+            if self._total_bytes <= self.max_bytes:
+                return
+        # First write (size not measured yet) or over budget
+        if self._evict_task is not None and not self._evict_task.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._total_bytes = self._measure_and_evict()
+            return
+        self._evict_task = loop.create_task(asyncio.to_thread(self._measure_and_evict))
+        self._evict_task.add_done_callback(self._on_evict_done)
+
+    def _on_evict_done(self, task: asyncio.Task):
+        """Record the measured cache size once the background walk finishes"""
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error is not None:
+            logger.warning(f"TTS cache eviction failed: {error}")
+            return
+        self._total_bytes = task.result()
+
+    def _scan_entries(self):
+        """List cached files as (mtime, size, path)"""
+        entries = []
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if entry.name.startswith("tts_") and entry.name.endswith(".ogg"):
+                    try:
+                        stat = entry.stat()
+                    except FileNotFoundError:
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return entries
+
+    def _measure_and_evict(self) -> int:
+        """Measure the cache and, when over budget, delete least recently used
+        files until under the low watermark. Returns the resulting total size."""
+        entries = self._scan_entries()
+        total = sum(size for _, size, _ in entries)
+        if total <= self.max_bytes:
+            return total
+
+        target = self.max_bytes * TTS_CACHE_LOW_WATERMARK
+        removed = 0
+
+        entries.sort()
+        for _, size, path in entries:
+            if total <= target:
+                break
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+            removed += 1
+
+        logger.info(f"TTS cache evicted {removed} files, now {total / (1024 * 1024):.1f} MB")
+        return total
+
     def cleanup_old_files(self, max_age_hours: int = 48):
         """Clean up old cache files"""
         import time
@@ -159,7 +391,7 @@ class PersistentTTSCache:
 _persistent_tts_cache = None
 
 
-def get_translation_cache() -> TTLCache:
+def get_translation_cache() -> TLRUCache:
     """Get translation cache instance"""
     return translation_cache
 
@@ -181,6 +413,7 @@ def clear_all_caches():
     """Clear all in-memory caches (for admin/maintenance)"""
     translation_cache.clear()
     tts_cache.clear()
+    message_translation_keys.clear()
     # Use .clear() to reset stats while keeping the same dict reference
     # This prevents race conditions with other threads holding old references
     with _stats_lock:
@@ -36,6 +36,8 @@ class TTSConfig:
     voice: str = "alloy"
     model: str = "tts-1"
     speed: float = 1.0
+    parallel_limit: int = 4
+    cache_max_mb: int = 500
 
 
 @dataclass
@@ -65,6 +67,7 @@ class DatabaseConfig:
     backup_enabled: bool = True
     backup_interval_hours: int = 24
     connection_timeout: int = 30
+    pool_size: int = 4
 
 
 @dataclass
@@ -82,6 +85,16 @@ class OpenAIConfig:
     timeout_seconds: int = 30
     max_retries: int = 3
     model: str = "gpt-4o"
+    connection_limit: int = 32
+    keepalive_connections: int = 16
+    keepalive_timeout: int = 75
+
+
+@dataclass
+class TelegramConfig:
+    """Telegram Bot API HTTP session configuration"""
+    connection_limit: int = 64
+    broadcast_concurrency: int = 30
 
 
 @dataclass
@@ -103,6 +116,7 @@ class Config:
     database: DatabaseConfig = field(default_factory=DatabaseConfig)
     logging: LoggingConfig = field(default_factory=LoggingConfig)
     openai: OpenAIConfig = field(default_factory=OpenAIConfig)
+    telegram: TelegramConfig = field(default_factory=TelegramConfig)
     security: SecurityConfig = field(default_factory=SecurityConfig)
 
 
@@ -156,6 +170,7 @@ class ConfigManager:
             database=DatabaseConfig(**data.get('database', {})),
             logging=LoggingConfig(**data.get('logging', {})),
             openai=OpenAIConfig(**data.get('openai', {})),
+            telegram=TelegramConfig(**data.get('telegram', {})),
             security=SecurityConfig(**data.get('security', {}))
         )
 
@@ -204,6 +219,10 @@ class ConfigManager:
         # TTS speed
         if not (0.25 <= config.tts.speed <= 4.0):
             raise ValueError("tts.speed must be between 0.25 and 4.0")
+        if config.tts.parallel_limit <= 0:
+            raise ValueError("tts.parallel_limit must be positive")
+        if config.tts.cache_max_mb <= 0:
+            raise ValueError("tts.cache_max_mb must be positive")
 
         # Retry limits
         if config.translation.max_retries < 0:
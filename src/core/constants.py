@@ -3,7 +3,7 @@ Core constants for the translation bot
 """
 import os
 import logging
-from typing import Final, Set, Dict, TypedDict
+from typing import Final, FrozenSet, Dict, TypedDict, NamedTuple
 
 logger = logging.getLogger(__name__)
 
@@ -22,22 +22,40 @@ SUPPORTED_LANGUAGES: Final[Dict[str, LanguageMetadata]] = {
     "vi": {"name": "Vietnamese", "flag": "🇻🇳"}
 }
 
-# Default languages for new users
-DEFAULT_LANGUAGES: Final[Set[str]] = {"ru", "en", "th"}
+
+class LangInfo(NamedTuple):
+    """Flattened language metadata for hot-path lookups"""
+    name: str
+    flag: str
+    code: str
+
+
+# Per-language metadata resolved once at import
+LANG: Final[Dict[str, LangInfo]] = {
+    code: LangInfo(meta["name"], meta["flag"], code)
+    for code, meta in SUPPORTED_LANGUAGES.items()
+}
+
+# Flag shown for languages outside SUPPORTED_LANGUAGES
+UNKNOWN_FLAG: Final[str] = "🏳️"
+
+# Default languages for new users; immutable because it is returned as-is to
+# (and shared between) callers of the preference lookups
+DEFAULT_LANGUAGES: Final[FrozenSet[str]] = frozenset(("ru", "en", "th"))
 
 # Load ADMIN_IDS from environment with validation
 ADMIN_USER_ID = os.getenv("ADMIN_USER_ID")
 if ADMIN_USER_ID:
     try:
-        ADMIN_IDS: Set[int] = {
+        ADMIN_IDS: FrozenSet[int] = frozenset(
             int(uid.strip())
             for uid in ADMIN_USER_ID.split(',')
             if uid.strip().isdigit()
-        }
+        )
         logger.info(f"Loaded {len(ADMIN_IDS)} admin user(s)")
     except ValueError as e:
         logger.error(f"Error parsing ADMIN_USER_ID: {e}")
-        ADMIN_IDS = set()
+        ADMIN_IDS = frozenset()
 else:
     logger.warning("No ADMIN_USER_ID configured")
-    ADMIN_IDS = set()
\ No newline at end of file
+    ADMIN_IDS = frozenset()
\ No newline at end of file
@@ -5,7 +5,7 @@ import logging
 from aiogram import F
 from aiogram.types import CallbackQuery
 from ..services.analytics import (
-    is_user_disabled, update_user_activity, get_user_preferences,
+    is_user_disabled, queue_user_activity, get_user_preferences,
     update_user_preference, toggle_voice_replies, is_admin, set_user_disabled
 )
 from ..core.app import audit_logger, db
@@ -39,7 +39,7 @@ async def show_menu_callback(callback: CallbackQuery):
         return
 
     # Update user activity
-    await update_user_activity(user_id, callback.from_user)
+    queue_user_activity(user_id, callback.from_user)
 
     # Static text to prevent layout jumps
     text = (
@@ -64,7 +64,7 @@ async def toggle_preference(callback: CallbackQuery):
         return
 
     # Update user activity
-    await update_user_activity(user_id, callback.from_user)
+    queue_user_activity(user_id, callback.from_user)
 
     if toggle_data == "voice_replies":
         # Handle voice replies toggle
@@ -276,11 +276,10 @@ async def admin_callback(callback: CallbackQuery):
     elif action == "model" and len(action_parts) > 2 and action_parts[2] == "select":
         # Show model selection menu
         audit_logger.info(f"ADMIN_ACTION: Admin {user_id} opened model selection")
-        from ..services.model_manager import get_model_manager
+        from ..services.model_manager import get_model_manager, get_model_info
 
-        model_manager = get_model_manager()
-        current_model = model_manager.get_current_model()
-        model_info = model_manager.get_model_info(current_model)
+        current_model = get_model_manager().get_current_model()
+        model_info = get_model_info(current_model)
 
         text = (
             f"🤖 *Translation Model Selection*\n\n"
@@ -300,13 +299,12 @@ async def admin_callback(callback: CallbackQuery):
             return
 
         new_model = action_parts[3]
-        from ..services.model_manager import get_model_manager
+        from ..services.model_manager import get_model_manager, get_model_info
 
-        model_manager = get_model_manager()
-        success = model_manager.set_model(new_model)
+        success = await get_model_manager().set_model(new_model)
 
         if success:
-            model_info = model_manager.get_model_info(new_model)
+            model_info = get_model_info(new_model)
             audit_logger.info(f"ADMIN_ACTION: Admin {user_id} changed model to {new_model}")
 
             text = (
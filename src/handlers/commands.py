@@ -20,7 +20,7 @@ def register_handlers(dp):
 async def start_handler(message: Message):
     """Handle /start command"""
     # Import services
-    from ..services.analytics import update_user_activity, is_user_disabled
+    from ..services.analytics import queue_user_activity, is_user_disabled
     from ..core.app import audit_logger
     from ..utils.keyboards import build_quick_menu_keyboard
 
@@ -35,11 +35,12 @@ async def start_handler(message: Message):
         return
 
     # Update user activity
-    await update_user_activity(user_id, message.from_user)
+    queue_user_activity(user_id, message.from_user)
 
     # Check for deep link (room join)
-    if message.text and len(message.text.split()) > 1:
-        param = message.text.split()[1]
+    parts = message.text.split(maxsplit=2) if message.text else []
+    if len(parts) > 1:
+        param = parts[1]
         if param.startswith("join_"):
             room_code = param.replace("join_", "")
             # Redirect to room join with language selection
@@ -76,7 +77,7 @@ async def start_handler(message: Message):
 async def menu_handler(message: Message):
     """Handle /menu command"""
     # Import services
-    from ..services.analytics import update_user_activity, is_user_disabled
+    from ..services.analytics import queue_user_activity, is_user_disabled
     from ..core.app import audit_logger
     from ..utils.keyboards import build_preferences_keyboard
 
@@ -91,7 +92,7 @@ async def menu_handler(message: Message):
         return
 
     # Update user activity
-    await update_user_activity(user_id, message.from_user)
+    queue_user_activity(user_id, message.from_user)
 
     # Static text - same everywhere to prevent layout jumps
     menu_text = (
@@ -105,7 +106,7 @@ async def menu_handler(message: Message):
 
 async def stats_handler(message: Message):
     """Handle /stats command - show user statistics"""
-    from ..services.analytics import update_user_activity, is_user_disabled
+    from ..services.analytics import queue_user_activity, is_user_disabled
     from ..core.app import audit_logger, db
     from ..core.constants import SUPPORTED_LANGUAGES
     from datetime import datetime
@@ -121,7 +122,7 @@ async def stats_handler(message: Message):
         return
 
     # Update user activity
-    await update_user_activity(user_id, message.from_user)
+    queue_user_activity(user_id, message.from_user)
 
     # Get user statistics
     stats = await db.get_user_stats(user_id)
@@ -181,7 +182,7 @@ _Use /menu to change language settings_"""
 async def admin_handler(message: Message):
     """Handle /admin command"""
     # Import services
-    from ..services.analytics import is_admin, update_user_activity, is_user_disabled
+    from ..services.analytics import is_admin, queue_user_activity, is_user_disabled
     from ..core.app import audit_logger
     from ..utils.keyboards import build_admin_dashboard_keyboard
     from ..utils.formatting import format_admin_dashboard
@@ -197,7 +198,7 @@ async def admin_handler(message: Message):
         return
 
     # Update user activity
-    await update_user_activity(user_id, message.from_user)
+    queue_user_activity(user_id, message.from_user)
 
     # Check admin privileges
     if not is_admin(user_id):
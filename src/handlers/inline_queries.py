@@ -136,7 +136,7 @@ async def inline_handler(inline_query: InlineQuery):
             lang_info = SUPPORTED_LANGUAGES[lang_code]
             all_translations_text += f"{lang_info['flag']} {translation}\n"
 
-        result_id = hashlib.md5(f"all:{query_text}".encode()).hexdigest()
+        result_id = hashlib.blake2b(f"all:{query_text}".encode(), digest_size=16).hexdigest()
         results.append(
             InlineQueryResultArticle(
                 id=result_id,
@@ -151,7 +151,7 @@ async def inline_handler(inline_query: InlineQuery):
     # Add individual translation options
     for lang_code, translation in sorted(translations.items()):
         lang_info = SUPPORTED_LANGUAGES[lang_code]
-        result_id = hashlib.md5(f"{lang_code}:{query_text}".encode()).hexdigest()
+        result_id = hashlib.blake2b(f"{lang_code}:{query_text}".encode(), digest_size=16).hexdigest()
 
         # Show original with translation
         message_text = f"{source_info['flag']} {query_text}\n{lang_info['flag']} {translation}"
@@ -1,16 +1,19 @@
 """
 Room command handlers for creating and managing translation rooms
 """
+import asyncio
 import logging
 from aiogram import F
-from aiogram.types import Message, CallbackQuery
-from aiogram.filters import Command
+from aiogram.types import Message, CallbackQuery, InlineKeyboardMarkup, InlineKeyboardButton
+from aiogram.filters import Command, CommandObject
 from aiogram.fsm.context import FSMContext
 
-from ..core.app import audit_logger
-from ..services.analytics import is_user_disabled, update_user_activity, get_user_preferences
+from ..core.app import audit_logger, bot, db
+from ..core.constants import SUPPORTED_LANGUAGES
+from ..services.analytics import is_user_disabled, queue_user_activity, get_user_preferences
 from ..services.room_manager import RoomManager
 from ..services.language import detect_language
+from ..utils.formatting import escape_markdown
 from ..utils.room_keyboards import (
     build_rooms_main_menu,
     build_room_info_keyboard,
@@ -21,9 +24,38 @@ from ..states.room_states import RoomCreation, RoomJoining
 
 logger = logging.getLogger(__name__)
 
+# Static texts
+ROOMS_MAIN_MENU_TEXT = (
+    "🏠 *Переговорные комнаты*\n\n"
+    "Создайте или присоединитесь к комнате для общения с автопереводом!\n\n"
+    "*Возможности:*\n"
+    "• Каждый пишет на своём языке\n"
+    "• Сообщения автоматически переводятся для других\n"
+    "• Ваш оригинальный текст сохраняется\n"
+    "• Поддержка 2-10 участников"
+)
+ROOM_INFO_FOOTER_ALL = "💬 Отправляйте сообщения - они будут переведены для всех участников!"
+ROOM_INFO_FOOTER = "💬 Отправляйте сообщения - они будут переведены!"
+
+# Inputs that skip the room name step
+SKIP_WORDS = ("/skip", "skip", "пропустить")
+
+
+def _build_room_info_text(room, member_count: int, footer: str) -> str:
+    """Build room info text shared by /room and the info button"""
+    expires_str = room.expires_at.strftime('%Y-%m-%d %H:%M') if room.expires_at else 'Никогда'
+    return (
+        f"🏠 *Комната: {room.code}*\n\n"
+        f"👥 Участники: {member_count}/{room.max_members}\n"
+        f"⏰ Истекает: {expires_str}\n\n"
+        f"{footer}"
+    )
+
 
 def register_handlers(dp):
     """Register room command handlers"""
+    # /room join CODE is routed by the filter before the generic /room handler
+    dp.message.register(room_join_command, Command("room", magic=F.args.regexp(r"(?i)^join\s+\S+")))
     dp.message.register(room_command, Command("room"))
 
     # Register FSM handlers
@@ -47,15 +79,7 @@ async def room_command(message: Message, state: FSMContext):
         return
 
     # Update activity
-    await update_user_activity(user_id, message.from_user)
-
-    # Check for /room join CODE
-    if message.text:
-        parts = message.text.strip().split()
-        if len(parts) >= 3 and parts[1].lower() == "join":
-            code = parts[2].upper()
-            await handle_join_command(message, code, state)
-            return
+    queue_user_activity(user_id, message.from_user)
 
     # Check if user has active room
     active_room = await RoomManager.get_active_room(user_id)
@@ -64,27 +88,19 @@ async def room_command(message: Message, state: FSMContext):
         # Show room info if already in room
         members = await RoomManager.get_room_members(active_room.id)
 
-        text = (
-            f"🏠 *Комната: {active_room.code}*\n\n"
-            f"👥 Участники: {len(members)}/{active_room.max_members}\n"
-            f"⏰ Истекает: {active_room.expires_at.strftime('%Y-%m-%d %H:%M') if active_room.expires_at else 'Никогда'}\n\n"
-            f"💬 Отправляйте сообщения - они будут переведены для всех участников!"
-        )
+        text = _build_room_info_text(active_room, len(members), ROOM_INFO_FOOTER_ALL)
         keyboard = build_room_info_keyboard(active_room, user_id)
         await message.reply(text, parse_mode="Markdown", reply_markup=keyboard)
     else:
         # Show main menu
-        text = (
-            "🏠 *Переговорные комнаты*\n\n"
-            "Создайте или присоединитесь к комнате для общения с автопереводом!\n\n"
-            "*Возможности:*\n"
-            "• Каждый пишет на своём языке\n"
-            "• Сообщения автоматически переводятся для других\n"
-            "• Ваш оригинальный текст сохраняется\n"
-            "• Поддержка 2-10 участников"
-        )
         keyboard = build_rooms_main_menu()
-        await message.reply(text, parse_mode="Markdown", reply_markup=keyboard)
+        await message.reply(ROOMS_MAIN_MENU_TEXT, parse_mode="Markdown", reply_markup=keyboard)
+
+
+async def room_join_command(message: Message, command: CommandObject, state: FSMContext):
+    """Handle /room join CODE command"""
+    code = command.args.split()[1].upper()
+    await handle_join_command(message, code, state)
 
 
 async def handle_cancel(callback: CallbackQuery, state: FSMContext):
@@ -106,7 +122,7 @@ async def room_callback(callback: CallbackQuery, state: FSMContext):
         return
 
     # Update activity
-    await update_user_activity(user_id, callback.from_user)
+    queue_user_activity(user_id, callback.from_user)
 
     if action == "create":
         # Create a new room
@@ -160,7 +176,6 @@ async def room_callback(callback: CallbackQuery, state: FSMContext):
             for member in members:
                 if member.user_id != user_id:
                     try:
-                        from ..core.app import bot
                         await bot.send_message(
                             member.user_id,
                             f"🔒 Комната {active_room.code} была закрыта создателем."
@@ -180,21 +195,15 @@ async def room_callback(callback: CallbackQuery, state: FSMContext):
             await callback.answer("❌ Not in any room", show_alert=True)
             return
 
-        members = await RoomManager.get_room_members(active_room.id)
-        if not members:
+        rows = await RoomManager.get_room_members_formatted(active_room.id)
+        if not rows:
             await callback.answer("❌ No members found", show_alert=True)
             return
 
-        from ..core.constants import SUPPORTED_LANGUAGES
-        from ..utils.formatting import escape_markdown
-
         text = f"👥 *Комната {active_room.code} - Участники*\n\n"
-        for member in members:
-            lang_info = SUPPORTED_LANGUAGES.get(member.language_code, {})
-            flag = lang_info.get('flag', '🏳️')
-            role = "👑" if member.is_creator() else "👤"
-            name = escape_markdown(member.display_name())
-            text += f"{role} {flag} {name}\n"
+        text += "\n".join(
+            f"{role} {flag} {escape_markdown(name)}" for role, flag, name in rows
+        ) + "\n"
 
         keyboard = build_members_list_keyboard(active_room)
         await callback.message.edit_text(text, parse_mode="Markdown", reply_markup=keyboard)
@@ -209,12 +218,7 @@ async def room_callback(callback: CallbackQuery, state: FSMContext):
 
         members = await RoomManager.get_room_members(active_room.id)
 
-        text = (
-            f"🏠 *Комната: {active_room.code}*\n\n"
-            f"👥 Участники: {len(members)}/{active_room.max_members}\n"
-            f"⏰ Истекает: {active_room.expires_at.strftime('%Y-%m-%d %H:%M') if active_room.expires_at else 'Никогда'}\n\n"
-            f"💬 Отправляйте сообщения - они будут переведены!"
-        )
+        text = _build_room_info_text(active_room, len(members), ROOM_INFO_FOOTER)
         keyboard = build_room_info_keyboard(active_room, user_id)
         try:
             await callback.message.edit_text(text, parse_mode="Markdown", reply_markup=keyboard)
@@ -248,7 +252,6 @@ async def room_callback(callback: CallbackQuery, state: FSMContext):
         )
 
         # Create keyboard
-        from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton
         share_keyboard = InlineKeyboardMarkup(inline_keyboard=[
             [InlineKeyboardButton(text="◀️ Назад к комнате", callback_data="room_info")]
         ])
@@ -286,7 +289,7 @@ async def handle_room_name(message: Message, state: FSMContext):
     room_name = message.text.strip()
 
     # Check for skip
-    if room_name.lower() in ['/skip', 'skip', 'пропустить']:
+    if room_name.casefold() in SKIP_WORDS:
         room_name = None
 
     # Validate name length
@@ -327,7 +330,6 @@ async def handle_room_language_selection(callback: CallbackQuery, state: FSMCont
     try:
         code = await RoomManager.create_room(user_id, lang_code, room_name)
 
-        from ..core.constants import SUPPORTED_LANGUAGES
         lang_info = SUPPORTED_LANGUAGES.get(lang_code, {})
         lang_flag = lang_info.get('flag', '🏳️')
         lang_name = lang_info.get('name', lang_code.upper())
@@ -364,27 +366,31 @@ async def handle_join_command(message: Message, code: str, state: FSMContext):
     """
     Handle /room join CODE command - ask for language selection
 
-    This is called from the main message handler when it detects 'room join' pattern
+    This is called from room_join_command once the filter matched 'join CODE'
     """
     user_id = message.from_user.id
 
+    # Disabled check (cached) runs alongside a single lookup of the target
+    # room and the user's current room
+    disabled, (room, active_room) = await asyncio.gather(
+        is_user_disabled(user_id),
+        db.get_room_and_active(user_id, code.upper()),
+    )
+
     # Check if user is disabled
-    if await is_user_disabled(user_id):
+    if disabled:
         await message.reply("❌ Доступ запрещен")
         return
 
     # Update activity
-    await update_user_activity(user_id, message.from_user)
+    queue_user_activity(user_id, message.from_user)
 
-    # Check if room exists
-    room_data = await RoomManager.get_active_room(user_id)
-    if room_data:
-        await message.reply(f"❌ Вы уже в комнате {room_data.code}")
+    # Check if user is already in a room
+    if active_room:
+        await message.reply(f"❌ Вы уже в комнате {active_room['code']}")
         return
 
     # Check if room code is valid
-    from ..core.app import db
-    room = await db.get_room_by_code(code.upper())
     if not room:
         await message.reply(f"❌ Комната {code.upper()} не найдена или закрыта")
         return
@@ -425,7 +431,6 @@ async def handle_join_language_selection(callback: CallbackQuery, state: FSMCont
         active_room = await RoomManager.get_active_room(user_id)
         members = await RoomManager.get_room_members(active_room.id)
 
-        from ..core.constants import SUPPORTED_LANGUAGES
         lang_info = SUPPORTED_LANGUAGES.get(lang_code, {})
         lang_flag = lang_info.get('flag', '🏳️')
         lang_name = lang_info.get('name', lang_code.upper())
@@ -446,7 +451,6 @@ async def handle_join_language_selection(callback: CallbackQuery, state: FSMCont
         for member in members:
             if member.user_id != user_id:
                 try:
-                    from ..core.app import bot
                     user_name = callback.from_user.username or callback.from_user.first_name or f"Пользователь {user_id}"
                     await bot.send_message(
                         member.user_id,
@@ -5,9 +5,10 @@ import logging
 from aiogram import F
 from aiogram.types import Message
 from aiogram.fsm.context import FSMContext
-from ..services.analytics import is_user_disabled, update_user_activity
+from ..services.analytics import is_user_disabled
 from ..services.translation import process_translation
 from ..core.app import audit_logger, bot, get_bot_info
+from ..core.cache import forget_message_translation
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +16,7 @@ logger = logging.getLogger(__name__)
 def register_handlers(dp):
     """Register text handlers"""
     dp.message.register(text_handler, F.text)
+    dp.edited_message.register(edited_text_handler, F.text)
 
 
 def is_reply_to_bot(message: Message, bot_id: int) -> bool:
@@ -99,4 +101,11 @@ async def text_handler(message: Message, state: FSMContext):
         await RoomManager.handle_room_message(message, active_room)
         return
 
-    await process_translation(message, text, source_type="text")
\ No newline at end of file
+    await process_translation(message, text, source_type="text")
+
+
+async def edited_text_handler(message: Message):
+    """Evict cached translations of an edited message's previous text"""
+    removed = forget_message_translation(message.chat.id, message.message_id)
+    if removed:
+        logger.info(f"Edited message {message.message_id} in chat {message.chat.id}: evicted {removed} cached translations")
@@ -1,23 +1,22 @@
 """
-Voice and audio message handlers with forced ffmpeg fallback for Python 3.13
+Voice and audio message handlers
 """
+import asyncio
 import logging
 import shutil
+from pathlib import Path
 from aiogram import F
+from aiogram.exceptions import TelegramAPIError
 from aiogram.types import Message
 from ..core.app import bot, config, audit_logger
 from ..services.analytics import is_user_disabled
 from ..services.translation import process_translation
+from ..services.voice import download_and_convert_audio, transcribe_audio
 
 logger = logging.getLogger(__name__)
 
-# Force use of ffmpeg version due to Python 3.13 audioop issue
-try:
-    from ..services.voice import download_and_convert_audio_ffmpeg as download_and_convert_audio, transcribe_audio
-    logger.info("Using ffmpeg fallback for audio processing (Python 3.13 compatibility)")
-except ImportError as e:
-    logger.error(f"Failed to import ffmpeg fallback: {e}")
-    raise
+# Strong references to pending cleanup tasks so they aren't garbage collected
+_cleanup_tasks: set = set()
 
 
 def register_handlers(dp):
@@ -63,16 +62,19 @@ async def voice_handler(message: Message):
             await status_msg.edit_text(f"❌ Audio too long. Please send messages under {minutes} minutes.")
             return
 
-        await status_msg.edit_text("🔄 Processing audio...")
-
-        # PARALLEL OPTIMIZATION: Download+convert and prepare for transcription in one step
+        # PARALLEL OPTIMIZATION: update status while download streams into ffmpeg.
+        # A failed status edit must not fail (or orphan) the conversion.
+        status_task = asyncio.create_task(_edit_status(status_msg, "🔄 Processing audio..."))
         try:
-            # Start download and conversion
-            audio_path = await download_and_convert_audio(file_info.file_path)
+            try:
+                audio_path = await download_and_convert_audio(file_info.file_path)
+            finally:
+                # Later status edits must not be overtaken by this one
+                await status_task
             temp_dir = audio_path.parent
             logger.info(f"Audio processed successfully: {audio_path}")
 
-            # Immediately start transcription (no extra status update delay)
+            # Whisper needs the complete file, so transcription starts right after conversion
             transcription = await transcribe_audio(audio_path)
             logger.info(f"Transcription successful: {len(transcription)} characters")
 
@@ -95,11 +97,11 @@ async def voice_handler(message: Message):
             return
 
         # EARLY RESPONSE: Show transcription immediately
-        from ..services.language import detect_language
+        from ..services.language import detect_language_async
         from ..core.constants import SUPPORTED_LANGUAGES
         from ..utils.formatting import escape_markdown
 
-        source_lang = detect_language(transcription)
+        source_lang = await detect_language_async(transcription)
         if source_lang:
             source_info = SUPPORTED_LANGUAGES[source_lang]
             max_len = 200
@@ -135,10 +137,25 @@ async def voice_handler(message: Message):
             await message.reply("❌ Couldn't process voice message. Please try again.")
 
     finally:
-        # Cleanup temporary files
+        # Cleanup temporary files off the event loop
         if temp_dir and temp_dir.exists():
-            try:
-                shutil.rmtree(temp_dir, ignore_errors=True)
-                logger.info(f"Cleaned up temp directory: {temp_dir}")
-            except Exception as e:
-                logger.warning(f"Failed to cleanup temp directory {temp_dir}: {e}")
+            task = asyncio.create_task(_remove_temp_dir(temp_dir))
+            _cleanup_tasks.add(task)
+            task.add_done_callback(_cleanup_tasks.discard)
+
+
+async def _edit_status(status_msg: Message, text: str):
+    """Edit a status message, ignoring Telegram errors (flood control, deleted, not modified)"""
+    try:
+        await status_msg.edit_text(text)
+    except TelegramAPIError as e:
+        logger.warning(f"Failed to update status message: {e}")
+
+
+async def _remove_temp_dir(temp_dir: Path):
+    """Remove a temp directory in a worker thread"""
+    try:
+        await asyncio.to_thread(shutil.rmtree, temp_dir, ignore_errors=True)
+        logger.info(f"Cleaned up temp directory: {temp_dir}")
+    except Exception as e:
+        logger.warning(f"Failed to cleanup temp directory {temp_dir}: {e}")
@@ -3,38 +3,32 @@ Main entry point for the Translation Bot
 """
 import asyncio
 import logging
-import signal
 import sys
 
 logger = logging.getLogger(__name__)
 
 
-async def shutdown(sig, loop, bot):
-    """Graceful shutdown handler"""
-    logger.info(f"Received exit signal {sig.name}...")
-
-    # Cancel all running tasks
-    tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
-    logger.info(f"Cancelling {len(tasks)} outstanding tasks")
-
-    for task in tasks:
-        task.cancel()
-
-    await asyncio.gather(*tasks, return_exceptions=True)
-
-    # Close bot session
-    logger.info("Closing bot session")
-    await bot.session.close()
-
-    # Stop event loop
-    loop.stop()
-    logger.info("Shutdown complete")
+async def startup_cleanup(db):
+    """Delete inactive users and stale TTS cache files concurrently"""
+    try:
+        deleted_users, (deleted_files, deleted_size) = await asyncio.gather(
+            db.delete_inactive_users(days=7),
+            db.clear_tts_cache(days=7),
+        )
+        logger.info(f"Cleanup complete: {deleted_users} users, {deleted_files} cache files ({deleted_size:.2f} MB)")
+    except Exception as e:
+        logger.error(f"Startup cleanup failed: {e}")
 
 
 async def main():
     """Start the bot"""
     logger.info("Starting Translation Bot with voice support...")
 
+    # Python 3.12+: new tasks run synchronously until their first suspension, so
+    # cache-hit paths (e.g. TTS served from disk) finish without a loop iteration
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
     # Import core components
     from .core.app import bot, dp, db
 
@@ -43,45 +37,54 @@ async def main():
         await db.init_db()
         logger.info("Database initialized successfully")
 
-        # Perform automatic cleanup on startup
-        logger.info("Running automatic cleanup on startup...")
-        deleted_users = await db.delete_inactive_users(days=7)
-        deleted_files, deleted_size = await db.clear_tts_cache(days=7)
-        logger.info(f"Cleanup complete: {deleted_users} users, {deleted_files} cache files ({deleted_size:.2f} MB)")
+        # Start batched activity writer
+        from .services.analytics import start_activity_flusher, stop_activity_flusher
+        start_activity_flusher()
     except Exception as e:
         logger.error(f"Database initialization failed: {e}")
         return
 
+    # Perform automatic cleanup on startup in the background so polling
+    # can start serving users immediately
+    logger.info("Running automatic cleanup on startup...")
+    cleanup_task = asyncio.create_task(startup_cleanup(db))
+
     # Register middleware
-    from .middlewares import RateLimitMiddleware, UserCheckMiddleware
-    dp.message.middleware(UserCheckMiddleware())
-    dp.message.middleware(RateLimitMiddleware())
+    from .core.app import config
+    from .middlewares import AccessAndRateMiddleware, UserCheckMiddleware
+    if config.rate_limits.enabled:
+        dp.message.middleware(AccessAndRateMiddleware())
+    else:
+        # No rate limiting: only the disabled-user check is needed
+        dp.message.middleware(UserCheckMiddleware())
     dp.callback_query.middleware(UserCheckMiddleware())
     logger.info("Middleware registered successfully")
 
     # Register handlers
     from . import handlers
+    from .services.language import shutdown_detect_pool
     handlers.register_all_handlers(dp)
 
-    # Get event loop and register signal handlers
-    loop = asyncio.get_event_loop()
-
-    # Register signal handlers for graceful shutdown
-    for sig in (signal.SIGINT, signal.SIGTERM):
-        loop.add_signal_handler(
-            sig,
-            lambda s=sig: asyncio.create_task(shutdown(s, loop, bot))
-        )
-
-    logger.info("Signal handlers registered for graceful shutdown")
+    # aiogram installs its own SIGINT/SIGTERM handlers that stop polling,
+    # runs shutdown hooks and closes the bot session
+    @dp.shutdown()
+    async def on_shutdown():
+        """Stop background work and release DB connections"""
+        logger.info("Shutting down...")
+        # Don't leave the startup cleanup running against a closed pool
+        if not cleanup_task.done():
+            cleanup_task.cancel()
+            await asyncio.gather(cleanup_task, return_exceptions=True)
+        await stop_activity_flusher()
+        shutdown_detect_pool()
+        db.close()
+        logger.info("Shutdown complete")
 
     try:
         await dp.start_polling(bot)
     except Exception as e:
         logger.error(f"Bot error: {e}")
-    finally:
-        await bot.session.close()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    asyncio.run(main())
@@ -1,7 +1,8 @@
 """
 Middleware components for bot
 """
+from .access import AccessAndRateMiddleware
 from .rate_limit import RateLimitMiddleware
 from .user_check import UserCheckMiddleware
 
-__all__ = ["RateLimitMiddleware", "UserCheckMiddleware"]
+__all__ = ["AccessAndRateMiddleware", "RateLimitMiddleware", "UserCheckMiddleware"]
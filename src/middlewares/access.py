@@ -0,0 +1,43 @@
+"""
+Combined access middleware for messages: disabled-user check and rate limiting
+"""
+import logging
+from typing import Callable, Dict, Any, Awaitable
+from aiogram.types import Message, TelegramObject
+
+from ..services.analytics import is_user_disabled
+from .rate_limit import RateLimitMiddleware
+from .user_check import reject_disabled_user
+
+logger = logging.getLogger(__name__)
+
+
+class AccessAndRateMiddleware(RateLimitMiddleware):
+    """
+    Middleware that checks if user is disabled and applies rate limits
+    in a single pass, instead of chaining two middlewares per message.
+    """
+
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: Dict[str, Any]
+    ) -> Any:
+        """Process middleware"""
+        # Only process messages
+        if not isinstance(event, Message) or event.from_user is None:
+            return await handler(event, data)
+
+        user_id = event.from_user.id
+
+        # Check if user is disabled
+        if await is_user_disabled(user_id):
+            await reject_disabled_user(event, user_id)
+            return
+
+        # Check rate limits
+        if not await self.check_rate_limit(event, user_id):
+            return
+
+        return await handler(event, data)
@@ -2,16 +2,20 @@
 Rate limiting middleware to prevent spam
 """
 import logging
-from typing import Callable, Dict, Any, Awaitable
+import time
+from typing import Callable, Dict, Any, Awaitable, List
 from aiogram import BaseMiddleware
 from aiogram.types import Message, TelegramObject
-from cachetools import TTLCache
 
 from ..core.constants import ADMIN_IDS
 from ..core.config import get_config
 
 logger = logging.getLogger(__name__)
 
+# Buckets are pruned of idle (fully refilled) entries every time they grow
+# by this many users
+BUCKET_PRUNE_INTERVAL = 10000
+
 
 class RateLimitMiddleware(BaseMiddleware):
     """
@@ -23,18 +27,19 @@ class RateLimitMiddleware(BaseMiddleware):
         super().__init__()
         self.config = get_config()
 
-        # Cache for tracking message counts per user
-        # Key: user_id, Value: message count
-        # TTL matches the rate limit window (60 seconds for messages_per_minute)
-        self.cache = TTLCache(maxsize=10000, ttl=60)
-
-        # Separate cache for voice messages (1 hour TTL)
-        self.voice_cache = TTLCache(maxsize=10000, ttl=3600)
+        # Token buckets per user
+        # Key: user_id, Value: [tokens left, last refill time.monotonic()]
+        # (updated in place). Message bucket refills over 60 seconds, voice
+        # bucket over 1 hour
+        self.message_buckets: Dict[int, List[float]] = {}
+        self.voice_buckets: Dict[int, List[float]] = {}
 
         self.enabled = self.config.rate_limits.enabled
         self.messages_per_minute = self.config.rate_limits.messages_per_minute
         self.voice_messages_per_hour = self.config.rate_limits.voice_messages_per_hour
         self.admin_bypass = self.config.rate_limits.admin_bypass
+        # Users exempt from rate limiting, resolved once at startup
+        self.bypass_ids = ADMIN_IDS if self.admin_bypass else frozenset()
 
         logger.info(
             f"Rate limiting initialized: "
@@ -44,6 +49,39 @@ class RateLimitMiddleware(BaseMiddleware):
             f"admin_bypass={self.admin_bypass}"
         )
 
+    @staticmethod
+    def _take_token(
+        buckets: Dict[int, List[float]],
+        user_id: int,
+        capacity: int,
+        window: float,
+        now: float
+    ) -> float:
+        """
+        Try to take one token from user's bucket.
+
+        Returns:
+            Tokens left after taking one, or -1 if the bucket is empty
+        """
+        entry = buckets.get(user_id)
+        if entry is None:
+            if len(buckets) % BUCKET_PRUNE_INTERVAL == BUCKET_PRUNE_INTERVAL - 1:
+                # Idle entries are fully refilled, so dropping them is lossless
+                for uid in [uid for uid, (_, last) in buckets.items() if now - last >= window]:
+                    del buckets[uid]
+            entry = buckets[user_id] = [float(capacity), now]
+
+        tokens = min(capacity, entry[0] + (now - entry[1]) * capacity / window)
+        entry[1] = now
+
+        if tokens < 1:
+            entry[0] = tokens
+            return -1
+
+        entry[0] = tokens - 1
+        return tokens - 1
+
+
     async def __call__(
         self,
         handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
@@ -55,59 +93,74 @@ class RateLimitMiddleware(BaseMiddleware):
         if not isinstance(event, Message):
             return await handler(event, data)
 
+        if not await self.check_rate_limit(event, event.from_user.id):
+            return
+
+        # Continue processing
+        return await handler(event, data)
+
+    async def check_rate_limit(self, message: Message, user_id: int) -> bool:
+        """
+        Take a token for the message and reply if the user is over the limit.
+
+        Returns:
+            True if the message may be processed
+        """
         # Skip if rate limiting is disabled
         if not self.enabled:
-            return await handler(event, data)
-
-        message: Message = event
-        user_id = message.from_user.id
+            return True
 
         # Bypass rate limiting for admins if configured
-        if self.admin_bypass and user_id in ADMIN_IDS:
-            logger.debug(f"Rate limit bypassed for admin user {user_id}")
-            return await handler(event, data)
+        if user_id in self.bypass_ids:
+            logger.debug("Rate limit bypassed for admin user %s", user_id)
+            return True
 
         # Check if message is voice/audio
         is_voice = message.voice is not None or message.audio is not None
 
+        now = time.monotonic()
+
         if is_voice:
             # Check voice message rate limit
-            voice_count = self.voice_cache.get(user_id, 0)
+            voice_left = self._take_token(
+                self.voice_buckets, user_id, self.voice_messages_per_hour, 3600, now
+            )
 
-            if voice_count >= self.voice_messages_per_hour:
+            if voice_left < 0:
                 logger.warning(
                     f"Voice rate limit exceeded for user {user_id}: "
-                    f"{voice_count}/{self.voice_messages_per_hour}"
+                    f"limit {self.voice_messages_per_hour} per hour"
                 )
                 await message.reply(
                     f"⚠️ Too many voice messages. "
                     f"Limit: {self.voice_messages_per_hour} per hour.\n"
                     f"Please wait before sending more voice messages."
                 )
-                return
+                return False
 
-            # Increment voice counter
-            self.voice_cache[user_id] = voice_count + 1
-            logger.debug(f"Voice message count for user {user_id}: {voice_count + 1}/{self.voice_messages_per_hour}")
+            logger.debug(
+                "Voice tokens left for user %s: %.1f/%s", user_id, voice_left, self.voice_messages_per_hour
+            )
 
         # Check regular message rate limit
-        message_count = self.cache.get(user_id, 0)
+        message_left = self._take_token(
+            self.message_buckets, user_id, self.messages_per_minute, 60, now
+        )
 
-        if message_count >= self.messages_per_minute:
+        if message_left < 0:
             logger.warning(
                 f"Message rate limit exceeded for user {user_id}: "
-                f"{message_count}/{self.messages_per_minute}"
+                f"limit {self.messages_per_minute} per minute"
             )
             await message.reply(
                 f"⚠️ Too many messages. "
                 f"Limit: {self.messages_per_minute} per minute.\n"
                 f"Please slow down."
             )
-            return
+            return False
 
-        # Increment message counter
-        self.cache[user_id] = message_count + 1
-        logger.debug(f"Message count for user {user_id}: {message_count + 1}/{self.messages_per_minute}")
+        logger.debug(
+            "Message tokens left for user %s: %.1f/%s", user_id, message_left, self.messages_per_minute
+        )
 
-        # Continue processing
-        return await handler(event, data)
+        return True
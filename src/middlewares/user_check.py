@@ -6,9 +6,13 @@ from typing import Callable, Dict, Any, Awaitable
 from aiogram import BaseMiddleware
 from aiogram.types import Message, CallbackQuery, TelegramObject
 
+from ..services.analytics import is_user_disabled
+
 logger = logging.getLogger(__name__)
 audit_logger = logging.getLogger("audit")
 
+DISABLED_MESSAGE = "❌ Access disabled. Contact support if you believe this is an error."
+
 
 class UserCheckMiddleware(BaseMiddleware):
     """
@@ -27,9 +31,6 @@ class UserCheckMiddleware(BaseMiddleware):
         data: Dict[str, Any]
     ) -> Any:
         """Process middleware"""
-        # Import here to avoid circular imports
-        from ..services.analytics import is_user_disabled
-
         # Extract user_id and message/callback from event
         user_id = None
         response_target = None
@@ -47,22 +48,24 @@ class UserCheckMiddleware(BaseMiddleware):
 
         # Check if user is disabled
         if await is_user_disabled(user_id):
-            # Log blocked access attempt
-            event_type = type(event).__name__
-            audit_logger.warning(
-                f"BLOCKED_ACCESS: Disabled user {user_id} attempted {event_type}"
-            )
-
-            # Send error message
-            error_message = "❌ Access disabled. Contact support if you believe this is an error."
-
-            if isinstance(event, Message):
-                await event.reply(error_message)
-            elif isinstance(event, CallbackQuery):
-                await event.answer(error_message, show_alert=True)
-
+            await reject_disabled_user(event, user_id)
             # Do not continue processing
             return
 
         # User is not disabled, continue processing
         return await handler(event, data)
+
+
+async def reject_disabled_user(event: TelegramObject, user_id: int):
+    """Log a blocked access attempt and notify the disabled user"""
+    # Log blocked access attempt
+    event_type = type(event).__name__
+    audit_logger.warning(
+        f"BLOCKED_ACCESS: Disabled user {user_id} attempted {event_type}"
+    )
+
+    # Send error message
+    if isinstance(event, Message):
+        await event.reply(DISABLED_MESSAGE)
+    elif isinstance(event, CallbackQuery):
+        await event.answer(DISABLED_MESSAGE, show_alert=True)
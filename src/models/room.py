@@ -1,12 +1,12 @@
 """
 Room models for translation rooms feature
 """
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional, List, Dict
 
 
-@dataclass
+@dataclass(slots=True)
 class Room:
     """Room model"""
     id: int
@@ -29,7 +29,7 @@ class Room:
         return datetime.now() > self.expires_at
 
 
-@dataclass
+@dataclass(slots=True)
 class RoomMember:
     """Room member model"""
     room_id: int
@@ -38,24 +38,33 @@ class RoomMember:
     role: str  # creator/member
     joined_at: datetime
     user_profile: Dict[str, Optional[str]]  # username, first_name, last_name
+    _display_name: Optional[str] = field(default=None, init=False, repr=False, compare=False)
 
     def is_creator(self) -> bool:
         """Check if member is room creator"""
         return self.role == 'creator'
 
     def display_name(self) -> str:
-        """Get display name for member"""
-        if self.user_profile.get('username'):
-            return f"@{self.user_profile['username']}"
-        if self.user_profile.get('first_name'):
-            name = self.user_profile['first_name']
-            if self.user_profile.get('last_name'):
-                name += f" {self.user_profile['last_name']}"
-            return name
-        return f"User {self.user_id}"
-
-
-@dataclass
+        """Get display name for member (computed once)"""
+        if self._display_name is not None:
+            return self._display_name
+
+        profile = self.user_profile
+        username = profile.get('username')
+        first_name = profile.get('first_name')
+        if username:
+            name = f"@{username}"
+        elif first_name:
+            last_name = profile.get('last_name')
+            name = f"{first_name} {last_name}" if last_name else first_name
+        else:
+            name = f"User {self.user_id}"
+
+        self._display_name = name
+        return name
+
+
+@dataclass(slots=True)
 class RoomMessage:
     """Room message model"""
     id: int
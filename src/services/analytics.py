@@ -1,52 +1,184 @@
 """
 User analytics and management service
 """
+import asyncio
 import logging
 from datetime import datetime
-from typing import Dict, Set, Optional
+from functools import lru_cache, partial
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Set, Optional, Tuple
 from aiogram.types import User
+from cachetools import TTLCache
 from ..core.constants import ADMIN_IDS, SUPPORTED_LANGUAGES
 from ..core.app import db
 
 logger = logging.getLogger(__name__)
 audit_logger = logging.getLogger("audit")
 
+# Short-lived cache of disabled status to avoid a DB hit on every event
+# Key: user_id, Value: is_disabled flag
+_disabled_cache = TTLCache(maxsize=50000, ttl=60)
+# In-flight lookups so concurrent cache misses for one user share a DB call
+_disabled_pending: Dict[int, asyncio.Task] = {}
+
+# Per-user settings (is_disabled, voice_replies_enabled, preferences) read on
+# every message and inline query; dropped by every settings write below
+_settings_cache = TTLCache(maxsize=10000, ttl=300)
+# In-flight settings lookups shared by concurrent cache misses
+_settings_pending: Dict[int, asyncio.Task] = {}
+# Per-user write counter: a lookup that raced a write is not cached. Only
+# needs to outlive an in-flight lookup (bounded by the SQLite busy timeout),
+# so entries expire instead of accumulating for every user ever written
+_settings_generation = TTLCache(maxsize=50000, ttl=300)
+
+# Background batching of activity updates (see queue_user_activity)
+ACTIVITY_FLUSH_INTERVAL = 1.0  # seconds
+ACTIVITY_FLUSH_BATCH_SIZE = 100
+_activity_queue: asyncio.Queue = asyncio.Queue()
+_activity_flusher_task: Optional[asyncio.Task] = None
+
+
+@lru_cache(maxsize=10000)
+def _profile_dict(username: Optional[str], first_name: Optional[str], last_name: Optional[str]) -> Mapping:
+    """Shared read-only profile mapping for a given set of profile fields.
+
+    A MappingProxyType so a caller cannot mutate the instance cached for
+    every user with the same profile.
+    """
+    return MappingProxyType({"username": username, "first_name": first_name, "last_name": last_name})
+
+
+def _user_profile(user: Optional[User]) -> Optional[Mapping]:
+    """Build (or reuse) the profile dict passed to the DB layer"""
+    if not user:
+        return None
+    return _profile_dict(user.username, user.first_name, user.last_name)
+
 
 async def get_user_analytics(user_id: int, user: Optional[User] = None) -> Dict:
     """Get or create user analytics entry from database"""
-    user_profile = None
-    if user:
-        user_profile = {
-            "username": user.username,
-            "first_name": user.first_name,
-            "last_name": user.last_name,
-        }
+    user_profile = _user_profile(user)
     return await db.get_user_analytics(user_id, user_profile)
 
 
 async def update_user_activity(user_id: int, user: Optional[User] = None):
     """Update user activity timestamp and message count atomically"""
-    user_profile = None
-    if user:
-        user_profile = {
-            "username": user.username,
-            "first_name": user.first_name,
-            "last_name": user.last_name,
-        }
+    user_profile = _user_profile(user)
 
     # Use atomic operation to prevent race conditions
     await db.increment_message_count(user_id, user_profile)
 
 
+def queue_user_activity(user_id: int, user: Optional[User] = None):
+    """Queue an activity update without waiting for the DB write.
+
+    Updates are flushed in batches by the background task started with
+    start_activity_flusher().
+    """
+    user_profile = _user_profile(user)
+    _activity_queue.put_nowait((user_id, user_profile, 1, 0))
+
+
+def queue_voice_response(user_id: int):
+    """Queue a voice response counter increment (see queue_user_activity)"""
+    _activity_queue.put_nowait((user_id, None, 0, 1))
+
+
+async def _flush_activity(batch: List[Tuple[int, Optional[Dict], int, int]]):
+    """Collapse queued updates per user and write them in one transaction"""
+    entries: Dict[int, List] = {}
+    for user_id, user_profile, messages, voice_responses in batch:
+        entry = entries.get(user_id)
+        if entry is None:
+            entries[user_id] = [user_id, messages, voice_responses, user_profile]
+        else:
+            entry[1] += messages
+            entry[2] += voice_responses
+            if user_profile:
+                entry[3] = user_profile
+
+    try:
+        await db.increment_activity_counts([tuple(e) for e in entries.values()])
+    except Exception as e:
+        logger.error(f"Failed to flush {len(batch)} activity updates: {e}")
+
+
+def _drain_activity_queue() -> List[Tuple[int, Optional[Dict], int, int]]:
+    """Take everything currently queued without waiting"""
+    batch = []
+    while not _activity_queue.empty():
+        batch.append(_activity_queue.get_nowait())
+    return batch
+
+
+async def _activity_flusher():
+    """Flush queued activity every ACTIVITY_FLUSH_INTERVAL or ACTIVITY_FLUSH_BATCH_SIZE records"""
+    loop = asyncio.get_running_loop()
+    batch = []
+    try:
+        while True:
+            batch = [await _activity_queue.get()]
+            deadline = loop.time() + ACTIVITY_FLUSH_INTERVAL
+            while len(batch) < ACTIVITY_FLUSH_BATCH_SIZE:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(_activity_queue.get(), timeout))
+                except TimeoutError:
+                    break
+            pending, batch = batch, []
+            await _flush_activity(pending)
+    except asyncio.CancelledError:
+        # Persist whatever is still pending before shutting down
+        batch.extend(_drain_activity_queue())
+        if batch:
+            await _flush_activity(batch)
+        raise
+
+
+def start_activity_flusher() -> asyncio.Task:
+    """Start the background activity flusher (idempotent)"""
+    global _activity_flusher_task
+    if _activity_flusher_task is None or _activity_flusher_task.done():
+        _activity_flusher_task = asyncio.create_task(_activity_flusher())
+    return _activity_flusher_task
+
+
+async def stop_activity_flusher():
+    """Stop the background activity flusher, flushing pending updates"""
+    global _activity_flusher_task
+    task, _activity_flusher_task = _activity_flusher_task, None
+    if task is not None and not task.done():
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    # Covers a flusher cancelled before it got to run
+    batch = _drain_activity_queue()
+    if batch:
+        await _flush_activity(batch)
+
+
 def is_admin(user_id: int) -> bool:
     """Check if user is admin"""
     return user_id in ADMIN_IDS
 
 
 async def is_user_disabled(user_id: int) -> bool:
-    """Check if user is disabled"""
-    analytics = await get_user_analytics(user_id)
-    return analytics["is_disabled"]
+    """Check if user is disabled (cached for a short TTL)"""
+    disabled = _disabled_cache.get(user_id)
+    if disabled is not None:
+        return disabled
+
+    task = _disabled_pending.get(user_id)
+    if task is None:
+        task = asyncio.ensure_future(db.is_user_disabled(user_id))
+        _disabled_pending[user_id] = task
+        task.add_done_callback(lambda _: _disabled_pending.pop(user_id, None))
+
+    disabled = await asyncio.shield(task)
+    _disabled_cache.setdefault(user_id, disabled)
+    return disabled
 
 
 async def set_user_disabled(user_id: int, disabled: bool) -> bool:
@@ -55,19 +187,26 @@ async def set_user_disabled(user_id: int, disabled: bool) -> bool:
     audit_logger.info(f"ADMIN_ACTION: User {user_id} has been {action}")
 
     # Use atomic operation to prevent race conditions
-    return await db.set_user_disabled(user_id, disabled)
+    success = await db.set_user_disabled(user_id, disabled)
+    if success:
+        _disabled_cache[user_id] = disabled
+    else:
+        _disabled_cache.pop(user_id, None)
+    _invalidate_settings(user_id)
+    return success
 
 
 async def is_voice_replies_enabled(user_id: int) -> bool:
     """Check if user has voice replies enabled"""
-    analytics = await get_user_analytics(user_id)
-    return analytics["voice_replies_enabled"]
+    settings = await get_user_settings(user_id)
+    return settings["voice_replies_enabled"]
 
 
 async def toggle_voice_replies(user_id: int) -> bool:
     """Toggle voice replies preference for user atomically"""
     # Use atomic operation to prevent race conditions
     enabled = await db.toggle_voice_replies(user_id)
+    _invalidate_settings(user_id)
     logger.info(f"User {user_id} voice replies {'enabled' if enabled else 'disabled'}")
     return enabled
 
@@ -78,17 +217,50 @@ async def increment_voice_responses(user_id: int):
     await db.increment_voice_responses(user_id)
 
 
+def _invalidate_settings(user_id: int):
+    """Drop cached settings after a write and stop in-flight lookups from caching theirs"""
+    _settings_generation[user_id] = _settings_generation.get(user_id, 0) + 1
+    _settings_cache.pop(user_id, None)
+    # Later readers start a fresh lookup instead of joining one from before the write
+    _settings_pending.pop(user_id, None)
+
+
+def _forget_settings_lookup(user_id: int, task: asyncio.Task):
+    """Remove a finished lookup unless it was already replaced by a newer one"""
+    if _settings_pending.get(user_id) is task:
+        del _settings_pending[user_id]
+
+
 async def get_user_settings(user_id: int) -> Dict:
-    """Get is_disabled, voice_replies_enabled, and preferences in one DB call."""
-    return await db.get_user_settings(user_id)
+    """Get is_disabled, voice_replies_enabled, and preferences in one DB call (cached)."""
+    settings = _settings_cache.get(user_id)
+    if settings is not None:
+        return settings
+
+    generation = _settings_generation.get(user_id, 0)
+    task = _settings_pending.get(user_id)
+    if task is None:
+        task = asyncio.ensure_future(db.get_user_settings(user_id))
+        _settings_pending[user_id] = task
+        task.add_done_callback(partial(_forget_settings_lookup, user_id))
+
+    settings = await asyncio.shield(task)
+    if _settings_generation.get(user_id, 0) == generation:
+        _settings_cache.setdefault(user_id, settings)
+    return settings
 
 
 async def get_user_preferences(user_id: int) -> Set[str]:
-    """Get user's enabled translation languages from database"""
+    """Get user's enabled translation languages (from cached settings if present)"""
+    settings = _settings_cache.get(user_id)
+    if settings is not None:
+        return settings["preferences"]
     return await db.get_user_preferences(user_id)
 
 
 async def update_user_preference(user_id: int, lang_code: str) -> Set[str]:
     """Toggle language preference for user atomically"""
     # Use atomic operation to prevent race conditions
-    return await db.toggle_language_preference(user_id, lang_code)
\ No newline at end of file
+    preferences = await db.toggle_language_preference(user_id, lang_code)
+    _invalidate_settings(user_id)
+    return preferences
\ No newline at end of file
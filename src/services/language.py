@@ -1,24 +1,123 @@
 """
 Language detection service
 """
+import asyncio
 import logging
+import multiprocessing
 import re
-from langdetect import detect, LangDetectException
+from concurrent.futures import ProcessPoolExecutor
+from functools import cache, lru_cache
+from typing import Optional
 from ..core.constants import SUPPORTED_LANGUAGES
 
 logger = logging.getLogger(__name__)
 
-
+# Texts longer than this are detected in a worker process so langdetect's
+# pure-Python scoring doesn't hold the GIL on the event loop thread
+OFFLOAD_MIN_CHARS = 512
+DETECT_POOL_WORKERS = 2
+
+_detect_pool: Optional[ProcessPoolExecutor] = None
+
+# Language mapping for commonly misdetected languages
+LANGUAGE_MAPPING = {
+    'mk': 'ru',  # Macedonian often confused with Russian
+    'bg': 'ru',  # Bulgarian might also be confused
+    'sr': 'ru',  # Serbian might also be confused
+    'uk': 'ru',  # Ukrainian might also be confused
+}
+
+# Common English words that should always be detected as English
+COMMON_ENGLISH = frozenset({
+    'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by',
+    'hello', 'hi', 'yes', 'no', 'ok', 'okay', 'thanks', 'please', 'sorry',
+    'what', 'where', 'when', 'why', 'how', 'who', 'which', 'that', 'this',
+    'is', 'are', 'was', 'were', 'be', 'been', 'have', 'has', 'had', 'do', 'does', 'did',
+    'can', 'could', 'should', 'would', 'will', 'shall', 'may', 'might', 'must'
+})
+
+# English-like fragments, matched as standalone words
+ENGLISH_PATTERN_WORDS = frozenset({'ing', 'ed', 'er', 'est', 'ly', 'tion', 'sion'})
+
+# Script flags returned by _detect_scripts
+SCRIPT_CYRILLIC = 1
+SCRIPT_LATIN = 2
+SCRIPT_ARABIC = 4
+SCRIPT_CHINESE = 8
+SCRIPT_THAI = 16
+SCRIPT_VIETNAMESE = 32
+
+# Texts written in only one of these scripts are detected without langdetect
+SCRIPT_LANGUAGES = {
+    SCRIPT_CYRILLIC: 'ru',
+    SCRIPT_ARABIC: 'ar',
+    SCRIPT_CHINESE: 'zh',
+    SCRIPT_THAI: 'th',
+}
+
+# Latin letters with Vietnamese diacritics
+_VIETNAMESE_CHARS = frozenset('àáảãạầấẩẫậèéẻẽẹềếểễệìíỉĩịòóỏõọồốổỗộùúủũụừứửữựỳýỷỹỵđĐ')
+
+# Precompiled detection patterns
+_RE_WORDS = re.compile(r'\b[a-z]+\b')
+_RE_BASIC_LATIN = re.compile(r'^[a-zA-Z0-9\s\.,\!\?\-@#$%&*()_+=\[\]{}|\\:";\'<>/`~]+$')
+_RE_FRENCH_WORDS = re.compile(r'\b(bon|jour|mer|ci|oui|non|je|tu|il|elle|nous|vous|ils|elles)\b')
+_RE_SIMPLE_LATIN = re.compile(r'^[a-zA-Z0-9\s\.,\!\?\-]+$')
+
+
+def _detect_scripts(text: str) -> int:
+    """
+    Detect scripts used in text in a single pass.
+
+    Returns:
+        Bitmask of SCRIPT_* flags; stops early once two scripts are found
+    """
+    flags = 0
+    for ch in text:
+        c = ord(ch)
+        if c < 0x80:
+            if not (0x41 <= c <= 0x5A or 0x61 <= c <= 0x7A):
+                continue
+            flag = SCRIPT_LATIN
+        elif 0x0410 <= c <= 0x044F or c == 0x0401 or c == 0x0451:
+            flag = SCRIPT_CYRILLIC
+        elif (0x0600 <= c <= 0x06FF or 0x0750 <= c <= 0x077F or 0x08A0 <= c <= 0x08FF
+              or 0xFB50 <= c <= 0xFDFF or 0xFE70 <= c <= 0xFEFF):
+            flag = SCRIPT_ARABIC
+        elif 0x4E00 <= c <= 0x9FFF:
+            flag = SCRIPT_CHINESE
+        elif 0x0E00 <= c <= 0x0E7F:
+            flag = SCRIPT_THAI
+        elif ch in _VIETNAMESE_CHARS:
+            flag = SCRIPT_VIETNAMESE
+        else:
+            continue
+
+        flags |= flag
+        if flags & (flags - 1):
+            # Mixed scripts, no need to scan further
+            break
+    return flags
+
+
+@cache
+def _load_langdetect():
+    """Import langdetect on first use (loading its language profiles is slow)"""
+    from langdetect import detect, LangDetectException
+    return detect, LangDetectException
+
+
+@lru_cache(maxsize=4096)
 def detect_language(text: str) -> str:
     """Detect language with improved logic for Cyrillic languages"""
+    scripts = _detect_scripts(text)
+
+    # Single non-Latin script: the answer doesn't depend on langdetect
+    script_language = SCRIPT_LANGUAGES.get(scripts)
+    if script_language:
+        return script_language
 
-    # Language mapping for commonly misdetected languages
-    LANGUAGE_MAPPING = {
-        'mk': 'ru',  # Macedonian often confused with Russian
-        'bg': 'ru',  # Bulgarian might also be confused
-        'sr': 'ru',  # Serbian might also be confused
-        'uk': 'ru',  # Ukrainian might also be confused
-    }
+    detect, LangDetectException = _load_langdetect()
 
     try:
         detected = detect(text)
@@ -36,62 +135,29 @@ def detect_language(text: str) -> str:
         # Additional heuristics for specific languages
 
         # Mixed language detection - if contains multiple scripts, return None
-        has_cyrillic = bool(re.search(r'[а-яё]', text.lower()))
-        has_latin = bool(re.search(r'[a-zA-Z]', text))
-        has_arabic = bool(re.search(r'[\u0600-\u06ff\u0750-\u077f\u08a0-\u08ff\ufb50-\ufdff\ufe70-\ufeff]', text))
-        has_chinese = bool(re.search(r'[\u4e00-\u9fff]', text))
-        has_thai = bool(re.search(r'[\u0e00-\u0e7f]', text))
-        has_vietnamese = bool(re.search(r'[àáảãạầấẩẫậèéẻẽẹềếểễệìíỉĩịòóỏõọồốổỗộùúủũụừứửữựỳýỷỹỵđĐ]', text))
-
-        script_count = sum([has_cyrillic, has_latin, has_arabic, has_chinese, has_thai, has_vietnamese])
-        if script_count > 1:
+        if scripts & (scripts - 1):
             return None  # Mixed languages
 
-        # Cyrillic script - Russian
-        if has_cyrillic:
-            return 'ru'
-
-        # Arabic: Arabic script (supports all Arabic ranges including extended)
-        if has_arabic:
-            return 'ar'
-
-        # Chinese: CJK Unified Ideographs (Simplified Chinese)
-        if has_chinese:
-            return 'zh'
-
-        # Thai: Thai script
-        if has_thai:
-            return 'th'
-
         # Vietnamese: Latin with diacritics
-        if has_vietnamese:
+        if scripts == SCRIPT_VIETNAMESE:
             return 'vi'
 
         # English detection - more sophisticated approach
-        if has_latin:
-            # Common English words that should always be detected as English
-            common_english = [
-                'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by',
-                'hello', 'hi', 'yes', 'no', 'ok', 'okay', 'thanks', 'please', 'sorry',
-                'what', 'where', 'when', 'why', 'how', 'who', 'which', 'that', 'this',
-                'is', 'are', 'was', 'were', 'be', 'been', 'have', 'has', 'had', 'do', 'does', 'did',
-                'can', 'could', 'should', 'would', 'will', 'shall', 'may', 'might', 'must'
-            ]
-
+        if scripts == SCRIPT_LATIN:
             # Check if text contains common English words
             text_lower = text.lower()
-            words = re.findall(r'\b[a-z]+\b', text_lower)
-            if words and any(word in common_english for word in words):
+            words = _RE_WORDS.findall(text_lower)
+            if not COMMON_ENGLISH.isdisjoint(words):
                 return 'en'
 
             # Check for English-like patterns
-            if re.search(r'\b(ing|ed|er|est|ly|tion|sion)\b', text_lower):
+            if not ENGLISH_PATTERN_WORDS.isdisjoint(words):
                 return 'en'
 
             # If text contains only basic Latin chars + numbers + punctuation and is not obviously other language
-            if re.match(r'^[a-zA-Z0-9\s\.,\!\?\-@#$%&*()_+=\[\]{}|\\:";\'<>/`~]+$', text):
+            if _RE_BASIC_LATIN.match(text):
                 # Exclude common non-English patterns
-                if not re.search(r'\b(bon|jour|mer|ci|oui|non|je|tu|il|elle|nous|vous|ils|elles)\b', text_lower):
+                if not _RE_FRENCH_WORDS.search(text_lower):
                     if len(text.strip()) >= 2:  # At least 2 characters
                         return 'en'
 
@@ -100,29 +166,37 @@ def detect_language(text: str) -> str:
     except LangDetectException:
         logger.warning(f"Language detection failed for: {text[:50]}...")
         # Fallback to heuristic detection using same logic as above
-        has_cyrillic = bool(re.search(r'[а-яё]', text.lower()))
-        has_latin = bool(re.search(r'[a-zA-Z]', text))
-        has_arabic = bool(re.search(r'[\u0600-\u06ff\u0750-\u077f\u08a0-\u08ff\ufb50-\ufdff\ufe70-\ufeff]', text))
-        has_chinese = bool(re.search(r'[\u4e00-\u9fff]', text))
-        has_thai = bool(re.search(r'[\u0e00-\u0e7f]', text))
-        has_vietnamese = bool(re.search(r'[àáảãạầấẩẫậèéẻẽẹềếểễệìíỉĩịòóỏõọồốổỗộùúủũụừứửữựỳýỷỹỵđĐ]', text))
-
-        script_count = sum([has_cyrillic, has_latin, has_arabic, has_chinese, has_thai, has_vietnamese])
-        if script_count > 1:
+        if scripts & (scripts - 1):
             return None
 
-        if has_cyrillic:
-            return 'ru'
-        elif has_arabic:
-            return 'ar'
-        elif has_chinese:
-            return 'zh'
-        elif has_thai:
-            return 'th'
-        elif has_vietnamese:
+        if scripts == SCRIPT_VIETNAMESE:
             return 'vi'
-        elif has_latin and len(text.strip()) >= 2:
+        elif scripts == SCRIPT_LATIN and len(text.strip()) >= 2:
             # Simple fallback for English - only for basic text
-            if re.match(r'^[a-zA-Z0-9\s\.,\!\?\-]+$', text):
+            if _RE_SIMPLE_LATIN.match(text):
                 return 'en'
-        return None
\ No newline at end of file
+        return None
+
+
+async def detect_language_async(text: str) -> str:
+    """Detect language without blocking the event loop on long texts"""
+    if len(text) <= OFFLOAD_MIN_CHARS:
+        return detect_language(text)
+
+    global _detect_pool
+    if _detect_pool is None:
+        # spawn: forking a process that already runs executor threads is unsafe
+        _detect_pool = ProcessPoolExecutor(
+            max_workers=DETECT_POOL_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_detect_pool, detect_language, text)
+
+
+def shutdown_detect_pool():
+    """Stop the language detection worker processes"""
+    global _detect_pool
+    if _detect_pool is not None:
+        _detect_pool.shutdown(wait=False, cancel_futures=True)
+        _detect_pool = None
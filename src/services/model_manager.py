@@ -1,15 +1,18 @@
 """
 Model selection management for admin
 """
+import asyncio
 import json
 import logging
+import os
 from pathlib import Path
-from typing import Dict, Optional
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional
 
 logger = logging.getLogger(__name__)
 
 # Available OpenAI models for translation
-AVAILABLE_MODELS = {
+AVAILABLE_MODELS: Mapping[str, Dict] = MappingProxyType({
     "gpt-4o-mini": {
         "name": "GPT-4o Mini",
         "description": "⚡ Fastest, most cost-effective",
@@ -20,7 +23,14 @@ AVAILABLE_MODELS = {
         "description": "🚀 Most capable, slower",
         "icon": "🚀"
     }
-}
+})
+
+_NO_MODEL_INFO: Mapping[str, str] = MappingProxyType({})
+
+
+def get_model_info(model: str) -> Mapping:
+    """Get information about a model"""
+    return AVAILABLE_MODELS.get(model, _NO_MODEL_INFO)
 
 
 class ModelManager:
@@ -34,15 +44,16 @@ class ModelManager:
 
     def _load_config(self):
         """Load model configuration from file"""
-        if self.config_path.exists():
-            try:
-                with open(self.config_path, 'r') as f:
-                    data = json.load(f)
-                    self._current_model = data.get("current_model")
-                    logger.info(f"Loaded model config: {self._current_model}")
-            except Exception as e:
-                logger.error(f"Failed to load model config: {e}")
-                self._current_model = None
+        try:
+            with open(self.config_path, 'r') as f:
+                data = json.load(f)
+                self._current_model = data.get("current_model")
+                logger.info(f"Loaded model config: {self._current_model}")
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.error(f"Failed to load model config: {e}")
+            self._current_model = None
 
         # Set default if not loaded
         if not self._current_model:
@@ -53,10 +64,12 @@ class ModelManager:
             logger.info(f"Using default model from config: {self._current_model}")
 
     def _save_config(self):
-        """Save model configuration to file"""
+        """Save model configuration to file (atomically via temp file + rename)"""
+        tmp_path = self.config_path.with_suffix(self.config_path.suffix + ".tmp")
         try:
-            with open(self.config_path, 'w') as f:
+            with open(tmp_path, 'w') as f:
                 json.dump({"current_model": self._current_model}, f, indent=2)
+            os.replace(tmp_path, self.config_path)
             logger.info(f"Saved model config: {self._current_model}")
         except Exception as e:
             logger.error(f"Failed to save model config: {e}")
@@ -65,23 +78,22 @@ class ModelManager:
         """Get currently selected model"""
         return self._current_model
 
-    def set_model(self, model: str) -> bool:
+    async def set_model(self, model: str) -> bool:
         """Set current model (must be in AVAILABLE_MODELS)"""
         if model not in AVAILABLE_MODELS:
             logger.error(f"Invalid model: {model}")
             return False
 
         self._current_model = model
-        self._save_config()
+        await asyncio.to_thread(self._save_config)
         logger.info(f"Model changed to: {model}")
         return True
 
-    def get_model_info(self, model: Optional[str] = None) -> Dict:
-        """Get information about a model"""
-        target_model = model or self._current_model
-        return AVAILABLE_MODELS.get(target_model, {})
+    def get_model_info(self, model: Optional[str] = None) -> Mapping:
+        """Get information about a model (current model by default)"""
+        return get_model_info(model or self._current_model)
 
-    def get_all_models(self) -> Dict:
+    def get_all_models(self) -> Mapping:
         """Get all available models"""
         return AVAILABLE_MODELS
 
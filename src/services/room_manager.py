@@ -1,23 +1,76 @@
 """
 Room Manager service for handling translation rooms
 """
+import asyncio
 import logging
+from collections import Counter
 from typing import Optional, List, Dict
 from aiogram.types import Message
 from aiogram import Bot
+from aiogram.exceptions import TelegramRetryAfter
+from cachetools import TTLCache
 
-from ..core.app import db, bot
+from ..core.app import config, db, bot
 from ..models.room import Room, RoomMember, room_from_dict, member_from_dict
-from ..services.translation import translate_text
+from ..services.translation import translate_text_stream
 from ..services.language import detect_language
-from ..core.constants import SUPPORTED_LANGUAGES
+from ..core.constants import LANG, UNKNOWN_FLAG
 
 logger = logging.getLogger(__name__)
 
+# Negative cache: users known not to be in any room (most traffic)
+# Key: user_id, Value: True
+_no_room_cache: TTLCache = TTLCache(maxsize=100_000, ttl=30)
+
+# Positive caches for the room message path, invalidated on join/leave/close
+# Key: user_id, Value: Room
+_active_room_cache: TTLCache = TTLCache(maxsize=100_000, ttl=30)
+# Key: room_id, Value: List[RoomMember]
+_members_cache: TTLCache = TTLCache(maxsize=10_000, ttl=30)
+# Key: room_id, Value: frozenset of member language codes (filled with _members_cache)
+_room_langs_cache: TTLCache = TTLCache(maxsize=10_000, ttl=30)
+
+# Limits concurrent send_message calls across all room broadcasts
+_send_semaphore = asyncio.Semaphore(config.telegram.broadcast_concurrency)
+
+
+async def _send_room_message(room_id: int, user_id: int, text: str):
+    """Send one broadcast message, retrying once if Telegram asks to slow down"""
+    async with _send_semaphore:
+        try:
+            try:
+                await bot.send_message(user_id, text)
+            except TelegramRetryAfter as e:
+                logger.warning(f"Flood control for user {user_id}, retrying in {e.retry_after}s")
+                await asyncio.sleep(e.retry_after)
+                await bot.send_message(user_id, text)
+            logger.info(f"Message sent to user {user_id} in room {room_id}")
+        except Exception as e:
+            logger.error(f"Error sending message to user {user_id}: {e}")
+
+
+def _drop_members_cache(room_id: int) -> Optional[List[RoomMember]]:
+    """Forget cached members (and their languages) of a room"""
+    _room_langs_cache.pop(room_id, None)
+    return _members_cache.pop(room_id, None)
+
 
 class RoomManager:
     """Manages translation rooms"""
 
+    @staticmethod
+    def _invalidate_room(room_id: int, members: Optional[List[RoomMember]] = None):
+        """Drop cached state for a closed room and its members"""
+        cached = _drop_members_cache(room_id)
+        members = members or cached
+        if members is None:
+            # Members unknown: rooms close rarely, so just drop all cached rooms
+            _active_room_cache.clear()
+            return
+        for member in members:
+            _active_room_cache.pop(member.user_id, None)
+            _no_room_cache[member.user_id] = True
+
     @staticmethod
     async def create_room(user_id: int, language_code: str, name: Optional[str] = None) -> str:
         """
@@ -32,6 +85,8 @@ class RoomManager:
             Room code
         """
         code = await db.create_room(user_id, language_code, name)
+        _no_room_cache.pop(user_id, None)
+        _active_room_cache.pop(user_id, None)
         logger.info(f"Room {code} created by user {user_id}")
         return code
 
@@ -58,19 +113,23 @@ class RoomManager:
         # Check if expired
         if room.is_expired():
             await db.close_room(room.id)
+            RoomManager._invalidate_room(room.id)
             return False, "❌ Room has expired"
 
         # Check if already a member
-        active_room = await db.get_user_active_room(user_id)
+        active_room = await RoomManager.get_active_room(user_id)
         if active_room:
-            if active_room['id'] == room.id:
+            if active_room.id == room.id:
                 return False, f"✅ You are already in room {code}"
             else:
-                return False, f"❌ You are already in room {active_room['code']}"
+                return False, f"❌ You are already in room {active_room.code}"
 
         # Join room
         success = await db.join_room(room.id, user_id, language_code)
         if success:
+            _no_room_cache.pop(user_id, None)
+            _active_room_cache.pop(user_id, None)
+            _drop_members_cache(room.id)
             logger.info(f"User {user_id} joined room {code}")
             return True, f"✅ Joined room {code}"
         else:
@@ -87,14 +146,17 @@ class RoomManager:
         Returns:
             (success, message)
         """
-        active_room = await db.get_user_active_room(user_id)
+        active_room = await RoomManager.get_active_room(user_id)
         if not active_room:
             return False, "❌ You are not in any room"
 
-        success = await db.leave_room(active_room['id'], user_id)
+        success = await db.leave_room(active_room.id, user_id)
         if success:
-            logger.info(f"User {user_id} left room {active_room['code']}")
-            return True, f"✅ Left room {active_room['code']}"
+            _no_room_cache[user_id] = True
+            _active_room_cache.pop(user_id, None)
+            _drop_members_cache(active_room.id)
+            logger.info(f"User {user_id} left room {active_room.code}")
+            return True, f"✅ Left room {active_room.code}"
         else:
             return False, "❌ Error leaving room"
 
@@ -109,10 +171,21 @@ class RoomManager:
         Returns:
             Room object or None
         """
+        if user_id in _no_room_cache:
+            return None
+
+        room = _active_room_cache.get(user_id)
+        if room is not None:
+            return room
+
         room_data = await db.get_user_active_room(user_id)
         if not room_data:
+            _no_room_cache[user_id] = True
             return None
-        return room_from_dict(room_data)
+
+        room = room_from_dict(room_data)
+        _active_room_cache[user_id] = room
+        return room
 
     @staticmethod
     async def get_room_members(room_id: int) -> List[RoomMember]:
@@ -125,8 +198,26 @@ class RoomManager:
         Returns:
             List of RoomMember objects
         """
-        members_data = await db.get_room_members(room_id)
-        return [member_from_dict(m) for m in members_data]
+        members = _members_cache.get(room_id)
+        if members is None:
+            members_data = await db.get_room_members(room_id)
+            members = [member_from_dict(m) for m in members_data]
+            _members_cache[room_id] = members
+            _room_langs_cache[room_id] = frozenset(m.language_code for m in members)
+        return members
+
+    @staticmethod
+    async def get_room_members_formatted(room_id: int) -> List[tuple]:
+        """
+        Get member list rows pre-formatted for display
+
+        Args:
+            room_id: Room ID
+
+        Returns:
+            List of (role_icon, flag, display_name) tuples
+        """
+        return await db.get_room_members_formatted(room_id)
 
     @staticmethod
     async def close_room(room_id: int, user_id: int) -> tuple[bool, str]:
@@ -140,15 +231,14 @@ class RoomManager:
         Returns:
             (success, message)
         """
-        # Get room to check creator
-        members = await RoomManager.get_room_members(room_id)
-        creator = next((m for m in members if m.is_creator()), None)
-
-        if not creator or creator.user_id != user_id:
+        # Check creator
+        creator_id = await db.get_room_creator(room_id)
+        if creator_id is None or creator_id != user_id:
             return False, "❌ Only the room creator can close the room"
 
         success = await db.close_room(room_id)
         if success:
+            RoomManager._invalidate_room(room_id)
             logger.info(f"Room {room_id} closed by creator {user_id}")
             return True, "✅ Room closed"
         else:
@@ -172,6 +262,11 @@ class RoomManager:
             text: Message text
             source_lang: Source language code
         """
+        # Single-language room in the sender's language: nothing to translate
+        room_langs = _room_langs_cache.get(room_id)
+        if room_langs is not None and room_langs <= {source_lang}:
+            return
+
         # Get all members except sender
         members = await RoomManager.get_room_members(room_id)
         other_members = [m for m in members if m.user_id != sender_id]
@@ -187,60 +282,60 @@ class RoomManager:
             return
 
         sender_name = sender.display_name()
-        sender_flag = SUPPORTED_LANGUAGES.get(source_lang, {}).get('flag', '🏳️')
+        sender_info = LANG.get(source_lang)
+        sender_flag = sender_info.flag if sender_info else UNKNOWN_FLAG
 
-        # Collect target languages from room members
-        target_langs = {m.language_code for m in other_members}
-
-        # Remove source language from targets
-        if source_lang in target_langs:
-            target_langs.remove(source_lang)
+        # Collect target languages from room members, most common first
+        lang_counts = Counter(m.language_code for m in other_members)
+        target_langs = set(lang_counts) - {source_lang}
 
         if not target_langs:
             logger.info(f"All members speak {source_lang}, no translation needed")
             return
 
-        # Translate to all unique target languages in the room
-        translations = await translate_text(text, source_lang, target_langs)
+        members_by_lang: Dict[str, List[RoomMember]] = {}
+        for member in other_members:
+            members_by_lang.setdefault(member.language_code, []).append(member)
+
+        # Translate to all unique target languages in the room, delivering each
+        # language to its members as soon as it streams in
+        header = f"💬 {sender_name} {sender_flag}:\n"
+        priority = [lang for lang, _ in lang_counts.most_common()]
+        sends = []
+        translated = set()
+        async for lang, translation in translate_text_stream(text, source_lang, target_langs, priority=priority):
+            translated.add(lang)
+            # Format once per target language; members sharing a language get the same text
+            formatted_message = f"{header}→ {LANG[lang].flag if lang in LANG else UNKNOWN_FLAG} {translation}"
+            sends.extend(
+                asyncio.ensure_future(_send_room_message(room_id, member.user_id, formatted_message))
+                for member in members_by_lang.get(lang, ())
+            )
 
-        if not translations:
+        if not translated:
             logger.error(f"Translation completely failed for room {room_id}")
             await message.reply("❌ Translation failed")
             return
 
         # Check for incomplete translations
-        missing_langs = target_langs - set(translations.keys())
+        missing_langs = target_langs - translated
         if missing_langs:
             logger.warning(f"Incomplete translation in room {room_id}. Missing: {missing_langs}")
 
-        # Send translated messages to each member
-        for member in other_members:
-            target_flag = SUPPORTED_LANGUAGES.get(member.language_code, {}).get('flag', '🏳️')
-
-            if member.language_code not in translations:
-                # Fallback: send original message with warning
+        # Fallback: send original message with warning
+        fallback_message = f"{header}⚠️ Translation unavailable. Original message:\n{text}"
+        for lang, lang_members in members_by_lang.items():
+            if lang in translated:
+                continue
+            for member in lang_members:
                 logger.warning(f"No translation for user {member.user_id} (lang: {member.language_code}), sending original")
-                formatted_message = (
-                    f"💬 {sender_name} {sender_flag}:\n"
-                    f"⚠️ Translation unavailable. Original message:\n"
-                    f"{text}"
-                )
-            else:
-                translation = translations[member.language_code]
-                # Format message
-                formatted_message = (
-                    f"💬 {sender_name} {sender_flag}:\n"
-                    f"→ {target_flag} {translation}"
-                )
-
-            try:
-                await bot.send_message(member.user_id, formatted_message)
-                logger.info(f"Message sent to user {member.user_id} in room {room_id}")
-            except Exception as e:
-                logger.error(f"Error sending message to user {member.user_id}: {e}")
+                sends.append(_send_room_message(room_id, member.user_id, fallback_message))
 
-        # Save message to history
-        await db.save_room_message(room_id, sender_id, text, source_lang)
+        # Deliver to all members and save message to history concurrently
+        await asyncio.gather(
+            *sends,
+            db.save_room_message(room_id, sender_id, text, source_lang),
+        )
         logger.info(f"Message broadcast in room {room_id}: {len(other_members)} recipients")
 
     @staticmethod
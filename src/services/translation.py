@@ -8,26 +8,28 @@ Features:
 - Context-aware translations
 """
 import asyncio
-import hashlib
 import logging
 import re
-import shutil
-import tempfile
 import time
+from functools import lru_cache
 from pathlib import Path
-from typing import AsyncGenerator, Dict, Set, Optional, Literal, Tuple
+from typing import AsyncGenerator, Dict, Set, Optional, Literal, Sequence, Tuple
 from aiogram.types import Message, FSInputFile
 from aiogram.exceptions import TelegramBadRequest
 from openai import AsyncOpenAI
 
 from ..core.app import openai_client, config, audit_logger
-from ..core.constants import SUPPORTED_LANGUAGES, DEFAULT_LANGUAGES
-from ..core.cache import get_translation_cache, get_persistent_tts_cache, normalize_text_for_cache, increment_cache_stat
+from ..core.constants import SUPPORTED_LANGUAGES, DEFAULT_LANGUAGES, LANG
+from ..core.cache import (
+    get_translation_cache, get_persistent_tts_cache, normalize_text_for_cache,
+    increment_cache_stat, make_translation_cache_key, get_cached_translations,
+    store_translations, remember_message_translation
+)
 from ..services.analytics import (
-    is_user_disabled, update_user_activity, get_user_preferences,
-    is_voice_replies_enabled, increment_voice_responses, get_user_settings
+    is_user_disabled, queue_user_activity, get_user_preferences,
+    is_voice_replies_enabled, queue_voice_response, get_user_settings
 )
-from ..services.language import detect_language
+from ..services.language import detect_language_async
 from ..services.model_manager import get_model_manager
 from ..utils.formatting import escape_markdown
 
@@ -37,6 +39,17 @@ logger = logging.getLogger(__name__)
 translation_cache = get_translation_cache()
 persistent_tts_cache = get_persistent_tts_cache()
 
+TTS_STREAM_CHUNK_SIZE = 16384
+
+# Limits concurrent TTS API calls across all users
+_tts_semaphore = asyncio.Semaphore(config.tts.parallel_limit)
+
+# Translation replies of one message sent to Telegram concurrently
+REPLY_SEND_CONCURRENCY = 4
+
+# Translation requests currently in flight, keyed by base cache key + languages
+_inflight_translations: Dict[tuple, asyncio.Task] = {}
+
 # Style detection and adaptation constants
 TextStyle = Literal["casual", "formal", "neutral"]
 
@@ -130,14 +143,38 @@ STYLE_NOTES_COMPACT: Dict[str, str] = {
 }
 
 
+@lru_cache(maxsize=64)
+def _target_langs_prompt_parts(target_langs_list: Tuple[str, ...]) -> Tuple[str, str, str]:
+    """Build the target-language dependent prompt parts (hints, names, output markers)"""
+    # Language-specific hints only for languages that need them
+    lang_hints = []
+    for lang in target_langs_list:
+        if lang == "th":
+            lang_hints.append("Thai: use ครับ/ค่ะ based on formality.")
+        elif lang == "vi":
+            lang_hints.append("Vietnamese: use appropriate pronouns.")
+
+    hints_line = (" " + " ".join(lang_hints)) if lang_hints else ""
+    langs_str = ", ".join(SUPPORTED_LANGUAGES[lang]["name"] for lang in target_langs_list)
+    output_markers = "\n".join(
+        f"[{lang.upper()}]translation[/{lang.upper()}]" for lang in target_langs_list
+    )
+    return hints_line, langs_str, output_markers
+
+
 def build_localization_prompt(
     text: str,
     source_lang: str,
     target_langs: Set[str],
     context: Optional[str] = None,
-    style: Optional[TextStyle] = None
+    style: Optional[TextStyle] = None,
+    priority: Optional[Sequence[str]] = None
 ) -> str:
-    """Build compact adaptive localization prompt with marker output format."""
+    """Build compact adaptive localization prompt with marker output format.
+
+    Languages listed in priority are requested first (then alphabetically), so
+    a streamed response completes them earliest.
+    """
     if source_lang not in SUPPORTED_LANGUAGES:
         raise ValueError(f"Unsupported source language: {source_lang}")
 
@@ -152,46 +189,59 @@ def build_localization_prompt(
     if style is None:
         style = detect_text_style(text)
 
-    target_langs_list = sorted(list(valid_target_langs))
+    if priority:
+        rank = {lang: i for i, lang in enumerate(priority)}
+        ordered_langs = tuple(sorted(valid_target_langs, key=lambda lang: (rank.get(lang, len(rank)), lang)))
+    else:
+        ordered_langs = tuple(sorted(valid_target_langs))
 
-    # Language-specific hints only for languages that need them
-    lang_hints = []
-    for lang in target_langs_list:
-        if lang == "th":
-            lang_hints.append("Thai: use ครับ/ค่ะ based on formality.")
-        elif lang == "vi":
-            lang_hints.append("Vietnamese: use appropriate pronouns.")
+    head, tail = _prompt_template(source_lang, ordered_langs, style)
+    if context:
+        return f"{head}\nContext: {context}{tail}{text}"
+    return head + tail + text
 
-    hints_line = (" " + " ".join(lang_hints)) if lang_hints else ""
-    context_line = f"\nContext: {context}" if context else ""
-    langs_str = ", ".join(SUPPORTED_LANGUAGES[lang]["name"] for lang in target_langs_list)
-    output_markers = "\n".join(
-        f"[{lang.upper()}]translation[/{lang.upper()}]" for lang in target_langs_list
-    )
 
-    prompt = (
+@lru_cache(maxsize=256)
+def _prompt_template(source_lang: str, target_langs_list: Tuple[str, ...], style: TextStyle) -> Tuple[str, str]:
+    """Static prompt text around the optional context line and the user text"""
+    hints_line, langs_str, output_markers = _target_langs_prompt_parts(target_langs_list)
+    head = (
         f"Localize for native speakers. Style: {style}. Preserve meaning, tone, emojis.\n"
-        f"{STYLE_NOTES_COMPACT[style]}{hints_line}{context_line}\n"
-        f"Source: {SUPPORTED_LANGUAGES[source_lang]['name']} → {langs_str}\n\n"
+        f"{STYLE_NOTES_COMPACT[style]}{hints_line}"
+    )
+    tail = (
+        f"\nSource: {SUPPORTED_LANGUAGES[source_lang]['name']} → {langs_str}\n\n"
         f"Output EXACTLY in this format (no JSON, no extra text):\n"
         f"{output_markers}\n\n"
-        f"TEXT: {text}"
+        f"TEXT: "
     )
+    return head, tail
+
 
-    return prompt
+# Output token budget per requested language: up to 1.5 tokens per source
+# character (translations can run longer than the source, and Thai tokenizes
+# densely) plus room for the [XX]...[/XX] markers
+TOKENS_PER_CHAR_NUM, TOKENS_PER_CHAR_DEN = 3, 2
+TOKENS_PER_LANG_OVERHEAD = 32
+
+
+def _translation_max_tokens(text: str, lang_count: int) -> int:
+    """Scale max_tokens to the expected output, capped by the configured limit"""
+    per_lang = len(text) * TOKENS_PER_CHAR_NUM // TOKENS_PER_CHAR_DEN + TOKENS_PER_LANG_OVERHEAD
+    return min(config.translation.max_tokens, lang_count * per_lang)
+
+
+# [XX]translation[/XX] blocks in model output
+_MARKER_BLOCK_RE = re.compile(r'\[([A-Z]{2,3})\](.*?)\[/\1\]', re.DOTALL)
 
 
 def parse_marker_response(content: str, target_langs: Set[str]) -> Dict[str, str]:
-    """Parse [XX]...[/XX] marker format from model response."""
+    """Parse [XX]...[/XX] marker format from model response in a single pass."""
     translations = {}
-    for lang_code in target_langs:
-        tag = lang_code.upper()
-        start_tag = f"[{tag}]"
-        end_tag = f"[/{tag}]"
-        if start_tag in content and end_tag in content:
-            start_idx = content.index(start_tag) + len(start_tag)
-            end_idx = content.index(end_tag)
-            translation = content[start_idx:end_idx].strip()
+    for match in _MARKER_BLOCK_RE.finditer(content):
+        lang_code = match.group(1).lower()
+        if lang_code in target_langs and lang_code not in translations:
+            translation = match.group(2).strip()
             if translation:
                 translations[lang_code] = translation
     return translations
@@ -233,18 +283,45 @@ async def translate_text(text: str, source_lang: str, target_langs: Set[str], co
     # Normalize text for better cache hits
     normalized_text = normalize_text_for_cache(text)
 
-    # Check cache first (include context and style in cache key)
-    context_hash = hashlib.md5(context.encode()).hexdigest()[:8] if context else ""
-    cache_key = hashlib.md5(f"{normalized_text}:{source_lang}:{','.join(sorted(target_langs))}:{context_hash}:{style}".encode()).hexdigest()
-    if cache_key in translation_cache:
+    # Check cache first, per target language (context and style are part of the key).
+    # Single lookups: a membership test followed by indexing can race TTL expiry
+    base_key = make_translation_cache_key(normalized_text, source_lang, context, style)
+    cached, missing = get_cached_translations(translation_cache, base_key, target_langs)
+    if not missing:
         increment_cache_stat("translation", hit=True)
         elapsed_ms = (time.time() - start_time) * 1000
         logger.info(f"Translation: {source_lang}→{list(target_langs)}, chars={len(text)}, style={style}, time={elapsed_ms:.0f}ms, cached=True")
-        return translation_cache[cache_key]
+        return cached
 
     # Track cache miss
     increment_cache_stat("translation", hit=False)
 
+    # Single-flight: identical concurrent requests share one API call.
+    # Only the languages not already cached are requested.
+    inflight_key = base_key + (tuple(sorted(missing)),)
+    task = _inflight_translations.get(inflight_key)
+    if task is None:
+        task = asyncio.ensure_future(
+            _request_translation(text, source_lang, missing, context, style, base_key, start_time)
+        )
+        _inflight_translations[inflight_key] = task
+        task.add_done_callback(lambda _: _inflight_translations.pop(inflight_key, None))
+    translations = await asyncio.shield(task)
+    if not cached:
+        return translations
+    return {**cached, **translations}
+
+
+async def _request_translation(
+    text: str,
+    source_lang: str,
+    target_langs: Set[str],
+    context: Optional[str],
+    style: TextStyle,
+    base_key: tuple,
+    start_time: float
+) -> Dict[str, str]:
+    """Call the model (with retries) and cache the result"""
     # Build adaptive localization prompt
     prompt = build_localization_prompt(text, source_lang, target_langs, context, style)
 
@@ -260,7 +337,7 @@ async def translate_text(text: str, source_lang: str, target_langs: Set[str], co
             response = await openai_client.chat.completions.create(
                 model=current_model,
                 messages=[{"role": "user", "content": prompt}],
-                max_tokens=config.translation.max_tokens,
+                max_tokens=_translation_max_tokens(text, len(target_langs)),
                 temperature=0.3,
             )
 
@@ -269,9 +346,10 @@ async def translate_text(text: str, source_lang: str, target_langs: Set[str], co
             # Parse marker format response
             translations = parse_marker_response(content, target_langs)
 
-            # Validate completeness
-            missing_langs = target_langs - set(translations.keys())
-            if missing_langs:
+            # Validate completeness (parsed keys are unique target languages,
+            # so matching counts means nothing is missing)
+            if len(translations) != len(target_langs):
+                missing_langs = target_langs - translations.keys()
                 logger.warning(f"Incomplete translation. Requested: {len(target_langs)}, Got: {len(translations)}, Missing: {missing_langs}")
                 if not translations:
                     if attempt < config.translation.max_retries - 1:
@@ -280,7 +358,7 @@ async def translate_text(text: str, source_lang: str, target_langs: Set[str], co
                     return {}
 
             # Cache successful translations
-            translation_cache[cache_key] = translations
+            store_translations(translation_cache, base_key, translations)
 
             # Log translation metrics
             elapsed_ms = (time.time() - start_time) * 1000
@@ -304,12 +382,14 @@ async def translate_text_stream(
     text: str,
     source_lang: str,
     target_langs: Set[str],
-    context: Optional[str] = None
+    context: Optional[str] = None,
+    priority: Optional[Sequence[str]] = None
 ) -> AsyncGenerator[Tuple[str, str], None]:
     """Async generator that yields (lang_code, translation) as each language completes.
 
-    On cache hit yields all translations immediately. On cache miss streams from
-    the API and yields each language as its closing marker is received.
+    Cached languages are yielded immediately. The rest are streamed from the
+    API and yielded as each language's closing marker is received; priority
+    orders the languages in the request.
     """
     if not text or not text.strip():
         return
@@ -324,20 +404,18 @@ async def translate_text_stream(
 
     style = detect_text_style(text)
     normalized_text = normalize_text_for_cache(text)
-    context_hash = hashlib.md5(context.encode()).hexdigest()[:8] if context else ""
-    cache_key = hashlib.md5(
-        f"{normalized_text}:{source_lang}:{','.join(sorted(target_langs))}:{context_hash}:{style}".encode()
-    ).hexdigest()
+    base_key = make_translation_cache_key(normalized_text, source_lang, context, style)
 
-    if cache_key in translation_cache:
+    cached, target_langs = get_cached_translations(translation_cache, base_key, target_langs)
+    for lang_code, translation in cached.items():
+        yield lang_code, translation
+    if not target_langs:
         increment_cache_stat("translation", hit=True)
-        for lang_code, translation in translation_cache[cache_key].items():
-            yield lang_code, translation
         return
 
     increment_cache_stat("translation", hit=False)
 
-    prompt = build_localization_prompt(text, source_lang, target_langs, context, style)
+    prompt = build_localization_prompt(text, source_lang, target_langs, context, style, priority)
 
     model_manager = get_model_manager()
     current_model = model_manager.get_current_model()
@@ -351,7 +429,7 @@ async def translate_text_stream(
         stream = await openai_client.chat.completions.create(
             model=current_model,
             messages=[{"role": "user", "content": prompt}],
-            max_tokens=config.translation.max_tokens,
+            max_tokens=_translation_max_tokens(text, len(target_langs)),
             temperature=0.3,
             stream=True,
         )
@@ -376,7 +454,7 @@ async def translate_text_stream(
                         yield lang_code, translation
 
         if translations:
-            translation_cache[cache_key] = translations
+            store_translations(translation_cache, base_key, translations)
 
         elapsed_ms = (time.time() - start_time) * 1000
         missing = target_langs - found_langs
@@ -403,97 +481,114 @@ async def translate_text_stream(
 
 
 async def generate_tts_audio(text: str) -> Optional[Path]:
-    """Generate TTS audio file using OpenAI with persistent caching"""
+    """Generate TTS audio file using OpenAI with persistent caching.
+
+    Returns the persistent cache file itself; callers only read it and must
+    not delete it.
+    """
     # Check persistent cache first
     cached_path = persistent_tts_cache.get(text)
     if cached_path:
-        # Return a copy for temporary use
-        temp_dir = Path(tempfile.mkdtemp())
-        temp_path = temp_dir / f"tts_copy_{cached_path.name}"
-        shutil.copy2(cached_path, temp_path)
-        return temp_path
+        return cached_path
 
+    part_path = persistent_tts_cache.new_part_path()
     try:
-        # Generate speech using OpenAI TTS
-        response = await openai_client.audio.speech.create(
+        # Generate speech using OpenAI TTS, streaming the audio straight to
+        # disk instead of holding the whole payload in memory
+        async with _tts_semaphore, openai_client.audio.speech.with_streaming_response.create(
             model=config.tts.model,
             voice=config.tts.voice,
             input=text,
             response_format="opus",  # Better compression for Telegram
             speed=config.tts.speed,
-        )
-
-        # Save to persistent cache
-        cached_path = persistent_tts_cache.set(text, response.content)
+        ) as response:
+            with open(part_path, "wb") as f:
+                async for chunk in response.iter_bytes(TTS_STREAM_CHUNK_SIZE):
+                    f.write(chunk)
 
-        # Return a copy for temporary use
-        temp_dir = Path(tempfile.mkdtemp())
-        temp_path = temp_dir / f"tts_copy_{cached_path.name}"
-        shutil.copy2(cached_path, temp_path)
+        # Move into persistent cache
+        cached_path = persistent_tts_cache.set_from_path(text, part_path)
 
         logger.info(f"TTS generated and cached for: {text[:50]}...")
-        return temp_path
+        return cached_path
 
     except Exception as e:
         logger.error(f"TTS generation error: {e}")
         return None
-
-
-async def generate_parallel_voice_responses(message: Message, user_id: int, translations: Dict[str, str]):
-    """Generate TTS responses in parallel for much faster processing"""
+    finally:
+        # Only left behind if the download or the move failed
+        part_path.unlink(missing_ok=True)
+
+
+async def generate_parallel_voice_responses(
+    message: Message,
+    user_id: int,
+    translations: Dict[str, str],
+    tts_tasks: Optional[Dict[str, asyncio.Task]] = None
+):
+    """Generate TTS responses in parallel for much faster processing
+
+    tts_tasks may hold TTS generations already started by the caller, keyed by
+    language; they are awaited instead of starting new ones. Languages whose
+    translations match after whitespace/Unicode normalization share a single
+    generation.
+    """
+    tts_tasks = tts_tasks or {}
     # Filter out too long translations
     valid_translations = {}
     for lang_code, translation in translations.items():
         if len(translation) > config.tts.max_characters:
-            lang_info = SUPPORTED_LANGUAGES[lang_code]
-            await message.reply(f"🎤 {lang_info['flag']} Голосовой ответ на {lang_info['name']} слишком длинный.")
+            lang_info = LANG[lang_code]
+            await message.reply(f"🎤 {lang_info.flag} Голосовой ответ на {lang_info.name} слишком длинный.")
         else:
             valid_translations[lang_code] = translation
 
     if not valid_translations:
         return
 
+    # One TTS generation per distinct (normalized) text, reusing ones already started
+    tts_texts = {
+        lang_code: normalize_text_for_cache(translation)
+        for lang_code, translation in valid_translations.items()
+    }
+    shared_tts: Dict[str, asyncio.Future] = {
+        tts_texts[lang_code]: task
+        for lang_code, task in tts_tasks.items()
+        if lang_code in tts_texts
+    }
+    for tts_text in tts_texts.values():
+        if tts_text not in shared_tts:
+            shared_tts[tts_text] = asyncio.ensure_future(generate_tts_audio(tts_text))
+
     # Generate all TTS audio files in parallel
-    async def generate_single_tts(lang_code: str, translation: str):
+    async def generate_single_tts(lang_code: str):
         try:
-            tts_audio_path = await generate_tts_audio(translation)
+            tts_audio_path = await shared_tts[tts_texts[lang_code]]
             return lang_code, tts_audio_path, None
         except Exception as e:
             return lang_code, None, e
 
     # Start all TTS generations in parallel
-    tts_tasks = [
-        generate_single_tts(lang_code, translation)
-        for lang_code, translation in valid_translations.items()
-    ]
+    tts_jobs = [generate_single_tts(lang_code) for lang_code in valid_translations]
 
-    # Wait for all TTS generations to complete
-    tts_results = await asyncio.gather(*tts_tasks, return_exceptions=True)
-
-    # Send voice messages and cleanup
-    temp_dirs_to_cleanup = []
+    # Send each voice message as soon as its audio is ready, overlapping
+    # Telegram uploads with the TTS generations still in flight
     successful_responses = 0
 
-    for result in tts_results:
-        if isinstance(result, Exception):
-            logger.error(f"TTS parallel generation error: {result}")
-            continue
-
-        lang_code, tts_audio_path, error = result
+    for next_result in asyncio.as_completed(tts_jobs):
+        lang_code, tts_audio_path, error = await next_result
 
         if error:
-            lang_info = SUPPORTED_LANGUAGES[lang_code]
+            lang_info = LANG[lang_code]
             logger.error(f"TTS error for user {user_id} in {lang_code}: {error}")
-            await message.reply(f"🎤 Ошибка создания голосового ответа на {lang_info['name']}.")
+            await message.reply(f"🎤 Ошибка создания голосового ответа на {lang_info.name}.")
             continue
 
         if tts_audio_path:
             try:
-                temp_dirs_to_cleanup.append(tts_audio_path.parent)
-
                 # Create caption with language name
-                lang_info = SUPPORTED_LANGUAGES[lang_code]
-                caption = f"{lang_info['flag']} {lang_info['name']}"
+                lang_info = LANG[lang_code]
+                caption = f"{lang_info.flag} {lang_info.name}"
 
                 # Send voice message
                 voice_input = FSInputFile(tts_audio_path, filename=f"voice_{lang_code}.ogg")
@@ -503,21 +598,13 @@ async def generate_parallel_voice_responses(message: Message, user_id: int, tran
                 logger.info(f"Voice response sent to user {user_id} in {lang_code}")
 
             except Exception as e:
-                lang_info = SUPPORTED_LANGUAGES[lang_code]
+                lang_info = LANG[lang_code]
                 logger.error(f"Voice message send error for {lang_code}: {e}")
-                await message.reply(f"🎤 Ошибка отправки голосового ответа на {lang_info['name']}.")
-
-    # Cleanup all temp directories
-    for temp_dir in temp_dirs_to_cleanup:
-        if temp_dir and temp_dir.exists():
-            try:
-                shutil.rmtree(temp_dir, ignore_errors=True)
-            except Exception as e:
-                logger.warning(f"Failed to cleanup TTS temp directory {temp_dir}: {e}")
+                await message.reply(f"🎤 Ошибка отправки голосового ответа на {lang_info.name}.")
 
     # Update analytics for successful responses
     if successful_responses > 0:
-        await increment_voice_responses(user_id)
+        queue_voice_response(user_id)
         logger.info(f"Parallel voice responses completed for user {user_id}: {successful_responses} sent")
 
 
@@ -557,10 +644,10 @@ async def process_translation(message: Message, text: str, source_type: str = "t
         )
         return
 
-    # Update user activity (fire-and-forget style, don't block translation)
-    asyncio.create_task(update_user_activity(user_id, message.from_user))
+    # Update user activity (batched in the background, don't block translation)
+    queue_user_activity(user_id, message.from_user)
 
-    source_lang = detect_language(text)
+    source_lang = await detect_language_async(text)
     if not source_lang:
         await message.reply(
             "❌ Language not supported or couldn't be detected.\n\n"
@@ -587,12 +674,17 @@ async def process_translation(message: Message, text: str, source_type: str = "t
         # If after removing source lang there are no targets, don't translate at all
         if not target_langs:
             await message.reply(
-                f"✅ Message detected in {SUPPORTED_LANGUAGES[source_lang]['name']}.\n\n"
-                f"💡 You only have {SUPPORTED_LANGUAGES[source_lang]['name']} selected for translation.\n"
+                f"✅ Message detected in {LANG[source_lang].name}.\n\n"
+                f"💡 You only have {LANG[source_lang].name} selected for translation.\n"
                 f"Use /settings to add more languages."
             )
             return
 
+    # TTS generations started while translations stream, keyed by language
+    # (languages with identical normalized text share a task)
+    tts_tasks: Dict[str, asyncio.Task] = {}
+    tts_by_text: Dict[str, asyncio.Task] = {}
+
     try:
         # Build context string from already-fetched context messages
         context = None
@@ -600,8 +692,8 @@ async def process_translation(message: Message, text: str, source_type: str = "t
             try:
                 context_parts = []
                 for msg in context_messages:
-                    lang_info = SUPPORTED_LANGUAGES.get(msg["language"], {"name": msg["language"]})
-                    context_parts.append(f"[{lang_info['name']}]: {msg['text']}")
+                    lang_info = LANG.get(msg["language"])
+                    context_parts.append(f"[{lang_info.name if lang_info else msg['language']}]: {msg['text']}")
                 context = "\n".join(context_parts)
             except Exception as e:
                 logger.warning(f"Could not build context for user {user_id}: {e}")
@@ -614,15 +706,23 @@ async def process_translation(message: Message, text: str, source_type: str = "t
         # Stream translations: send each language as it arrives from the API
         translations = {}
         status_deleted = False
+        send_tasks = []
+        send_limit = asyncio.Semaphore(REPLY_SEND_CONCURRENCY)
+
+        async def send_translation(translation: str):
+            async with send_limit:
+                await message.answer(translation)
+
+        voice_enabled = user_settings["voice_replies_enabled"]
 
         # For voice without early_response_msg: show transcription before first translation
         if source_type == "voice" and early_response_msg is None:
-            source_info = SUPPORTED_LANGUAGES[source_lang]
+            source_info = LANG[source_lang]
             max_len = config.translation.display_truncate_length
             display_text = text if len(text) <= max_len else text[:max_len-3] + "..."
             escaped_text = escape_markdown(display_text)
             await status_msg.edit_text(
-                f"🎤 {source_info['flag']} Transcribed ({source_info['name']}):\n"
+                f"🎤 {source_info.flag} Transcribed ({source_info.name}):\n"
                 f"_{escaped_text}_\n\n🔄 Translating...",
                 parse_mode="Markdown"
             )
@@ -630,14 +730,34 @@ async def process_translation(message: Message, text: str, source_type: str = "t
 
         async for lang_code, translation in translate_text_stream(text, source_lang, target_langs, context=context):
             translations[lang_code] = translation
+            if voice_enabled and len(translation) <= config.tts.max_characters:
+                # Start speech synthesis while the remaining languages stream in
+                tts_text = normalize_text_for_cache(translation)
+                task = tts_by_text.get(tts_text)
+                if task is None:
+                    task = tts_by_text[tts_text] = asyncio.create_task(generate_tts_audio(tts_text))
+                tts_tasks[lang_code] = task
+            # Send without blocking the stream; later languages keep arriving meanwhile
             if not status_deleted:
-                await status_msg.delete()
+                send_tasks.append(asyncio.create_task(status_msg.delete()))
                 status_deleted = True
-            await message.answer(translation)
+            send_tasks.append(asyncio.create_task(send_translation(translation)))
 
         if not status_deleted:
             await status_msg.delete()
 
+        for result in await asyncio.gather(*send_tasks, return_exceptions=True):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to send translation reply to user {user_id}: {result}")
+
+        # Remember the cache entries so an edit of this message can evict them
+        if source_type == "text" and translations:
+            stripped = text.strip()
+            base_key = make_translation_cache_key(
+                normalize_text_for_cache(stripped), source_lang, context, detect_text_style(stripped)
+            )
+            remember_message_translation(message.chat.id, message.message_id, base_key, translations)
+
         # Save message to context history (non-blocking)
         try:
             target_langs_str = ",".join(sorted(target_langs))
@@ -650,11 +770,15 @@ async def process_translation(message: Message, text: str, source_type: str = "t
             return
 
         # Generate and send voice response if enabled (PARALLEL TTS)
-        if user_settings["voice_replies_enabled"] and translations:
-            await generate_parallel_voice_responses(message, user_id, translations)
+        if voice_enabled and translations:
+            await generate_parallel_voice_responses(message, user_id, translations, tts_tasks)
 
     except Exception as e:
         logger.error(f"Translation error: {e}")
+        # Drop TTS work started for this message (finished audio stays cached)
+        for task in tts_tasks.values():
+            if not task.done():
+                task.cancel()
         if early_response_msg:
             try:
                 await early_response_msg.delete()
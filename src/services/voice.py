@@ -1,11 +1,11 @@
 """
-Voice processing service with ffmpeg fallback for Python 3.13
+Voice processing service: audio conversion via ffmpeg and Whisper transcription
 """
 import asyncio
 import logging
+import os
 import shutil
 import tempfile
-import subprocess
 from pathlib import Path
 from typing import Optional
 
@@ -14,63 +14,125 @@ from ..core.app import bot, openai_client, config
 logger = logging.getLogger(__name__)
 
 
-async def download_and_convert_audio_ffmpeg(file_path: str, output_format: str = "wav") -> Path:
-    """Download and convert audio file using ffmpeg directly"""
-    temp_dir = Path(tempfile.mkdtemp())
+def _audio_temp_root() -> str:
+    """Pick a RAM-backed dir for intermediate audio when available"""
+    candidate = os.environ.get("AUDIO_TMPDIR", "/dev/shm")
+    if os.path.isdir(candidate) and os.access(candidate, os.W_OK | os.X_OK):
+        return candidate
+    return tempfile.gettempdir()
+
+
+# Downloaded/converted audio is short-lived; keep it off the disk when possible
+TEMP_AUDIO_DIR = _audio_temp_root()
 
+# Containers ffmpeg can demux from a non-seekable pipe (m4a/mp4 need seeking)
+PIPE_SAFE_SUFFIXES = {".oga", ".ogg", ".opus", ".mp3", ".wav"}
+
+
+async def _feed_telegram_file(file_path: str, stdin: asyncio.StreamWriter):
+    """Stream a Telegram file into ffmpeg stdin chunk by chunk"""
+    url = bot.session.api.file_url(bot.token, file_path)
     try:
-        # Download file from Telegram
-        downloaded_file = await bot.download_file(file_path)
+        async for chunk in bot.session.stream_content(url=url, raise_for_status=True):
+            stdin.write(chunk)
+            await stdin.drain()
+    except (BrokenPipeError, ConnectionResetError):
+        # ffmpeg exited early; its return code and stderr describe why
+        pass
+    finally:
+        stdin.close()
 
-        # Save original file
-        original_path = temp_dir / "original.ogg"
-        with open(original_path, "wb") as f:
-            f.write(downloaded_file.read())
+
+async def download_and_convert_audio_ffmpeg(file_path: str, output_format: str = "wav") -> Path:
+    """Download and convert audio file using ffmpeg directly.
+
+    For streamable containers the download is piped into ffmpeg stdin so
+    transfer and transcoding overlap instead of running back to back. With a
+    local Bot API server ffmpeg reads the server's file in place.
+    """
+    temp_dir = Path(tempfile.mkdtemp(dir=TEMP_AUDIO_DIR))
+    is_local = bot.session.api.is_local
+    stream_input = (
+        Path(file_path).suffix.lower() in PIPE_SAFE_SUFFIXES
+        and not is_local
+    )
+
+    try:
+        if stream_input:
+            input_arg = "pipe:0"
+        elif is_local:
+            # The file is already on this machine; no need to copy it first
+            input_arg = str(bot.session.api.wrap_local_file.to_local(file_path))
+        else:
+            # Download file from Telegram
+            original_path = temp_dir / f"original{Path(file_path).suffix or '.ogg'}"
+            await bot.download_file(file_path, destination=original_path)
+            input_arg = str(original_path)
 
         # Convert using ffmpeg directly
         converted_path = temp_dir / f"converted.{output_format}"
-        
+
         # Use ffmpeg to convert with optimal settings for Whisper
         cmd = [
-            "ffmpeg", "-i", str(original_path),
+            "ffmpeg", "-i", input_arg,
             "-ac", "1",  # mono
             "-ar", str(config.audio.input_sample_rate),  # sample rate
             "-y",  # overwrite output
             str(converted_path)
         ]
-        
+
         process = await asyncio.create_subprocess_exec(
             *cmd,
-            stdout=asyncio.subprocess.PIPE,
+            stdin=asyncio.subprocess.PIPE if stream_input else asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.DEVNULL,
             stderr=asyncio.subprocess.PIPE
         )
-        
-        stdout, stderr = await process.communicate()
-        
+
+        try:
+            if stream_input:
+                _, stderr = await asyncio.gather(
+                    _feed_telegram_file(file_path, process.stdin),
+                    process.stderr.read(),
+                )
+            else:
+                stderr = await process.stderr.read()
+            await process.wait()
+        except BaseException:
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+            raise
+
         if process.returncode != 0:
             logger.error(f"ffmpeg conversion failed: {stderr.decode()}")
             raise Exception(f"Audio conversion failed: {stderr.decode()}")
-        
-        logger.info(f"Audio converted with ffmpeg: {original_path} -> {converted_path}")
+
+        logger.info(f"Audio converted with ffmpeg: {file_path} -> {converted_path}")
         return converted_path
 
     except Exception as e:
         logger.error(f"Audio conversion failed: {e}")
-        # Cleanup on error
-        shutil.rmtree(temp_dir, ignore_errors=True)
+        # Cleanup on error, off the event loop
+        await asyncio.to_thread(shutil.rmtree, temp_dir, ignore_errors=True)
         raise
 
 
+# ffmpeg is the only conversion backend (pydub/audioop is gone in Python 3.13)
+download_and_convert_audio = download_and_convert_audio_ffmpeg
+
+
 async def transcribe_audio(audio_path: Path) -> str:
     """Transcribe audio using OpenAI Whisper with retry logic"""
+    # Read once, off the event loop; retries reuse the same bytes
+    audio_data = await asyncio.to_thread(audio_path.read_bytes)
+
     for attempt in range(config.openai.max_retries):
         try:
-            with open(audio_path, "rb") as audio_file:
-                transcription = await openai_client.audio.transcriptions.create(
-                    model="whisper-1",
-                    file=audio_file,
-                    language=None  # Auto-detect language
-                )
+            transcription = await openai_client.audio.transcriptions.create(
+                model="whisper-1",
+                file=(audio_path.name, audio_data),
+                language=None  # Auto-detect language
+            )
 
             return transcription.text.strip()
 
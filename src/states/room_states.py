@@ -1,16 +1,39 @@
 """
 FSM states for room creation and joining
 """
+import sys
+
 from aiogram.fsm.state import State, StatesGroup
 
 
+class InternedState(State):
+    """State whose full name is computed once and interned.
+
+    aiogram's State.state rebuilds the "Group:name" string on every access,
+    and the FSM filter compares against it for each routed update.
+    """
+
+    _full_state: str | None = None
+
+    @property
+    def state(self) -> str | None:
+        if self._full_state is None:
+            return super().state
+        return self._full_state
+
+    def set_parent(self, group: "type[StatesGroup]") -> None:
+        super().set_parent(group)
+        self._full_state = None
+        self._full_state = sys.intern(super().state)
+
+
 class RoomCreation(StatesGroup):
     """States for room creation flow"""
-    waiting_for_name = State()
-    waiting_for_language = State()
+    waiting_for_name = InternedState()
+    waiting_for_language = InternedState()
 
 
 class RoomJoining(StatesGroup):
     """States for room joining flow"""
-    waiting_for_code = State()
-    waiting_for_language = State()
+    waiting_for_code = InternedState()
+    waiting_for_language = InternedState()
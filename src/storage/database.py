@@ -2,53 +2,127 @@
 Database manager for persistent storage
 """
 import asyncio
+import json
 import logging
+import queue
 import sqlite3
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Optional, Set, List
 from contextlib import asynccontextmanager
-from ..core.constants import DEFAULT_LANGUAGES
+from ..core.constants import DEFAULT_LANGUAGES, SUPPORTED_LANGUAGES
 
 logger = logging.getLogger(__name__)
 
+# Inline language -> flag mapping so member lists can be formatted in SQL
+_MEMBER_FLAG_SQL = "CASE rm.language_code {} ELSE '🏳️' END".format(
+    " ".join(
+        f"WHEN '{code}' THEN '{meta['flag']}'"
+        for code, meta in SUPPORTED_LANGUAGES.items()
+    )
+)
+
+# Statements shared by several methods; one string each so they share a
+# single entry in each connection's prepared statement cache
+_SQL_SELECT_PREFERENCES = "SELECT language_code FROM user_language_preferences WHERE user_id = ?"
+_SQL_INSERT_PREFERENCE = "INSERT OR IGNORE INTO user_language_preferences (user_id, language_code) VALUES (?, ?)"
+_SQL_ENSURE_USER = "INSERT OR IGNORE INTO users (id, last_activity) VALUES (?, CAST(strftime('%s', 'now') AS INTEGER))"
+
+# Per-connection prepared statement cache size (sqlite3 default is 128)
+STATEMENT_CACHE_SIZE = 256
+
+
 class DatabaseManager:
     """SQLite database manager for user data persistence with connection pooling"""
 
-    def __init__(self, db_path: str = "data/translator_bot.db"):
+    def __init__(self, db_path: str = "data/translator_bot.db", pool_size: int = 4):
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(exist_ok=True, parents=True)
 
+        # Idle connections reused across executor threads
+        self._pool: queue.LifoQueue = queue.LifoQueue(maxsize=pool_size)
+        # Dedicated DB threads, one per pooled connection: queries don't queue
+        # behind unrelated work in the default executor, and a burst never
+        # opens connections beyond the pool
+        self._executor = ThreadPoolExecutor(max_workers=pool_size, thread_name_prefix="db")
+
         # Enable WAL mode for better concurrent access
         self._init_wal_mode()
 
     def _init_wal_mode(self):
-        """Initialize WAL mode for better concurrent access"""
+        """Initialize WAL mode for better concurrent access.
+
+        The connection used for this is kept as the pool's first idle
+        connection rather than being closed.
+        """
+        try:
+            conn = self._get_connection()
+        except Exception as e:
+            logger.warning(f"Could not open database to enable WAL mode: {e}")
+            return
         try:
-            conn = sqlite3.connect(self.db_path)
             conn.execute("PRAGMA journal_mode=WAL")
-            conn.execute("PRAGMA busy_timeout=5000")
-            conn.execute("PRAGMA synchronous=NORMAL")
-            conn.close()
             logger.info("WAL mode enabled for database")
         except Exception as e:
             logger.warning(f"Could not enable WAL mode: {e}")
+        self._release_connection(conn)
 
     def _get_connection(self) -> sqlite3.Connection:
         """Get database connection with proper settings"""
         conn = sqlite3.connect(
             self.db_path,
             timeout=30.0,
-            check_same_thread=False
+            check_same_thread=False,
+            cached_statements=STATEMENT_CACHE_SIZE
         )
         conn.row_factory = sqlite3.Row
         # Enable foreign keys
         conn.execute("PRAGMA foreign_keys=ON")
+        # Per-connection tuning (journal_mode=WAL is persisted in the file)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-65536")  # 64 MiB page cache
+        conn.execute("PRAGMA mmap_size=268435456")
         return conn
 
+    def _acquire_connection(self) -> sqlite3.Connection:
+        """Take an idle connection from the pool or open a new one"""
+        try:
+            return self._pool.get_nowait()
+        except queue.Empty:
+            return self._get_connection()
+
+    def _release_connection(self, conn: sqlite3.Connection):
+        """Return a connection to the pool, closing it if the pool is full"""
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+            self._pool.put_nowait(conn)
+        except (queue.Full, sqlite3.Error):
+            conn.close()
+
+    def close(self):
+        """Close all pooled connections, refreshing planner statistics first"""
+        # Let queued queries finish before their connections are closed
+        self._executor.shutdown(wait=True)
+        optimized = False
+        while True:
+            try:
+                conn = self._pool.get_nowait()
+            except queue.Empty:
+                break
+            if not optimized:
+                try:
+                    conn.execute("PRAGMA optimize")
+                    optimized = True
+                except sqlite3.Error as e:
+                    logger.warning(f"PRAGMA optimize failed: {e}")
+            conn.close()
+
     async def init_db(self):
         """Initialize database with required tables"""
-        conn = self._get_connection()
+        conn = self._acquire_connection()
         try:
             conn.executescript("""
                 CREATE TABLE IF NOT EXISTS users (
@@ -60,7 +134,7 @@ class DatabaseManager:
                     voice_replies_enabled BOOLEAN DEFAULT FALSE,
                     message_count INTEGER DEFAULT 0,
                     voice_responses_sent INTEGER DEFAULT 0,
-                    last_activity TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    last_activity INTEGER DEFAULT (CAST(strftime('%s', 'now') AS INTEGER)),
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                 );
 
@@ -108,7 +182,9 @@ class DatabaseManager:
                 );
 
                 CREATE INDEX IF NOT EXISTS idx_users_last_activity ON users(last_activity);
-                CREATE INDEX IF NOT EXISTS idx_user_prefs_user_id ON user_language_preferences(user_id);
+                -- The (user_id, language_code) primary key already covers
+                -- lookups by user_id; a separate index only costs writes
+                DROP INDEX IF EXISTS idx_user_prefs_user_id;
                 CREATE INDEX IF NOT EXISTS idx_rooms_code ON rooms(code);
                 CREATE INDEX IF NOT EXISTS idx_rooms_status ON rooms(status);
                 CREATE INDEX IF NOT EXISTS idx_room_members_user ON room_members(user_id);
@@ -142,22 +218,59 @@ class DatabaseManager:
                 CREATE INDEX IF NOT EXISTS idx_feedback_user ON translation_feedback(user_id, created_at DESC);
                 CREATE INDEX IF NOT EXISTS idx_feedback_type ON translation_feedback(feedback_type);
             """)
+            # users.last_activity holds Unix seconds; convert rows written as
+            # timestamp text by older versions. CURRENT_TIMESTAMP wrote UTC
+            # ("YYYY-MM-DD HH:MM:SS"), datetime.isoformat() wrote local time
+            # (with a "T"); unparseable values fall back to now.
+            migrated = conn.execute("""
+                UPDATE users SET last_activity = COALESCE(
+                    CAST(CASE WHEN instr(last_activity, 'T') > 0
+                              THEN strftime('%s', last_activity, 'utc')
+                              ELSE strftime('%s', last_activity) END AS INTEGER),
+                    CAST(strftime('%s', 'now') AS INTEGER)
+                )
+                WHERE typeof(last_activity) = 'text'
+            """).rowcount
+            if migrated:
+                logger.info(f"Converted last_activity of {migrated} users to Unix time")
             conn.commit()
             logger.info("Database initialized successfully")
         except Exception as e:
             logger.error(f"Database initialization failed: {e}")
             raise
         finally:
-            conn.close()
+            self._release_connection(conn)
+
+    async def is_user_disabled(self, user_id: int) -> bool:
+        """Check if user is disabled, registering unknown users"""
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, self._is_user_disabled_sync, user_id
+        )
+
+    def _is_user_disabled_sync(self, user_id: int) -> bool:
+        """Synchronous version of is_user_disabled"""
+        conn = self._acquire_connection()
+        try:
+            row = conn.execute(
+                "SELECT is_disabled FROM users WHERE id = ? LIMIT 1",
+                (user_id,)
+            ).fetchone()
+        finally:
+            self._release_connection(conn)
+
+        if row is None:
+            # First contact: create the user with default preferences
+            return self._get_user_analytics_sync(user_id)["is_disabled"]
+        return bool(row["is_disabled"])
 
     async def get_user_settings(self, user_id: int) -> Dict:
         """Get is_disabled, voice_replies_enabled, and preferences in one query."""
-        return await asyncio.get_event_loop().run_in_executor(
-            None, self._get_user_settings_sync, user_id
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, self._get_user_settings_sync, user_id
         )
 
     def _get_user_settings_sync(self, user_id: int) -> Dict:
-        conn = self._get_connection()
+        conn = self._acquire_connection()
         try:
             row = conn.execute(
                 "SELECT is_disabled, voice_replies_enabled FROM users WHERE id = ?",
@@ -165,7 +278,7 @@ class DatabaseManager:
             ).fetchone()
 
             prefs_rows = conn.execute(
-                "SELECT language_code FROM user_language_preferences WHERE user_id = ?",
+                _SQL_SELECT_PREFERENCES,
                 (user_id,)
             ).fetchall()
             preferences = {r["language_code"] for r in prefs_rows} or DEFAULT_LANGUAGES
@@ -178,21 +291,21 @@ class DatabaseManager:
                 "preferences": preferences,
             }
         finally:
-            conn.close()
+            self._release_connection(conn)
 
     async def get_user_preferences(self, user_id: int) -> Set[str]:
         """Get user's language preferences from database"""
         # Run in thread pool to avoid blocking
-        return await asyncio.get_event_loop().run_in_executor(
-            None, self._get_user_preferences_sync, user_id
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, self._get_user_preferences_sync, user_id
         )
 
     def _get_user_preferences_sync(self, user_id: int) -> Set[str]:
         """Synchronous version of get_user_preferences"""
-        conn = self._get_connection()
+        conn = self._acquire_connection()
         try:
             cursor = conn.execute(
-                "SELECT language_code FROM user_language_preferences WHERE user_id = ?",
+                _SQL_SELECT_PREFERENCES,
                 (user_id,)
             )
             preferences = {row["language_code"] for row in cursor.fetchall()}
@@ -203,59 +316,73 @@ class DatabaseManager:
 
             return preferences
         finally:
-            conn.close()
+            self._release_connection(conn)
 
     async def update_user_preferences(self, user_id: int, preferences: Set[str]):
         """Update user's language preferences in database"""
-        await asyncio.get_event_loop().run_in_executor(
-            None, self._update_user_preferences_sync, user_id, preferences
+        await asyncio.get_running_loop().run_in_executor(
+            self._executor, self._update_user_preferences_sync, user_id, preferences
         )
 
     def _update_user_preferences_sync(self, user_id: int, preferences: Set[str]):
         """Synchronous version of update_user_preferences"""
-        conn = self._get_connection()
+        conn = self._acquire_connection()
         try:
-            # Delete existing preferences
-            conn.execute(
-                "DELETE FROM user_language_preferences WHERE user_id = ?",
-                (user_id,)
-            )
+            if self._replace_preferences(conn, user_id, preferences):
+                conn.commit()
+        finally:
+            self._release_connection(conn)
 
-            # Insert new preferences
-            for lang_code in preferences:
-                conn.execute(
-                    "INSERT INTO user_language_preferences (user_id, language_code) VALUES (?, ?)",
-                    (user_id, lang_code)
-                )
+    def _replace_preferences(self, conn: sqlite3.Connection, user_id: int, preferences: Set[str]) -> bool:
+        """Write only the difference between stored and new preferences.
 
-            conn.commit()
-        finally:
-            conn.close()
+        Returns:
+            True if any row was added or removed (caller commits)
+        """
+        current = {row["language_code"] for row in conn.execute(_SQL_SELECT_PREFERENCES, (user_id,))}
+        to_add = set(preferences) - current
+        to_remove = current - set(preferences)
+        if to_add:
+            conn.executemany(_SQL_INSERT_PREFERENCE, [(user_id, lang_code) for lang_code in to_add])
+        if to_remove:
+            placeholders = ",".join("?" * len(to_remove))
+            conn.execute(
+                f"DELETE FROM user_language_preferences WHERE user_id = ? AND language_code IN ({placeholders})",
+                (user_id, *to_remove)
+            )
+        return bool(to_add or to_remove)
 
     async def get_user_analytics(self, user_id: int, user_profile: Optional[Dict] = None) -> Dict:
         """Get or create user analytics from database"""
-        return await asyncio.get_event_loop().run_in_executor(
-            None, self._get_user_analytics_sync, user_id, user_profile
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, self._get_user_analytics_sync, user_id, user_profile
         )
 
     def _get_user_analytics_sync(self, user_id: int, user_profile: Optional[Dict] = None) -> Dict:
         """Synchronous version of get_user_analytics"""
-        conn = self._get_connection()
+        conn = self._acquire_connection()
         try:
-            cursor = conn.execute(
-                "SELECT * FROM users WHERE id = ?",
-                (user_id,)
-            )
-            row = cursor.fetchone()
-
-            if row:
+            # One statement for both paths: always yields a row, with the user
+            # columns NULL if the user does not exist yet
+            row = conn.execute("""
+                SELECT u.*,
+                       (SELECT json_group_array(language_code)
+                        FROM user_language_preferences
+                        WHERE user_id = q.user_id) AS preferences
+                FROM (SELECT ? AS user_id) q
+                LEFT JOIN users u ON u.id = q.user_id
+            """, (user_id,)).fetchone()
+            existing_preferences = set(json.loads(row["preferences"]))
+
+            if row["id"] is not None:
                 # User exists, return data
-                analytics = {
+                return {
                     "is_disabled": bool(row["is_disabled"]),
                     "voice_replies_enabled": bool(row["voice_replies_enabled"]),
                     "message_count": row["message_count"],
                     "voice_responses_sent": row["voice_responses_sent"],
-                    "last_activity": datetime.fromisoformat(row["last_activity"]),
+                    "last_activity": datetime.fromtimestamp(row["last_activity"]) if row["last_activity"] else datetime.now(),
+                    "preferred_targets": existing_preferences or DEFAULT_LANGUAGES,
                     "user_profile": {
                         "username": row["username"],
                         "first_name": row["first_name"],
@@ -263,109 +390,77 @@ class DatabaseManager:
                     }
                 }
 
-                # Get preferences
-                prefs_cursor = conn.execute(
-                    "SELECT language_code FROM user_language_preferences WHERE user_id = ?",
-                    (user_id,)
-                )
-                preferences = {prow["language_code"] for prow in prefs_cursor.fetchall()}
-                if not preferences:
-                    preferences = DEFAULT_LANGUAGES
-
-                analytics["preferred_targets"] = preferences
-                return analytics
-            else:
-                # Create new user - check if preferences already exist
-                prefs_cursor = conn.execute(
-                    "SELECT language_code FROM user_language_preferences WHERE user_id = ?",
-                    (user_id,)
-                )
-                existing_preferences = {prow["language_code"] for prow in prefs_cursor.fetchall()}
-
-                # Use existing preferences if any, otherwise use default languages
-                preferences = existing_preferences if existing_preferences else DEFAULT_LANGUAGES
-
-                analytics = {
-                    "is_disabled": False,
-                    "voice_replies_enabled": False,
-                    "message_count": 0,
-                    "voice_responses_sent": 0,
-                    "last_activity": datetime.now(),
-                    "preferred_targets": preferences,
-                    "user_profile": user_profile or {
-                        "username": None,
-                        "first_name": None,
-                        "last_name": None,
-                    }
+            # Create new user, keeping preferences that already exist if any
+            preferences = existing_preferences or DEFAULT_LANGUAGES
+
+            analytics = {
+                "is_disabled": False,
+                "voice_replies_enabled": False,
+                "message_count": 0,
+                "voice_responses_sent": 0,
+                "last_activity": datetime.now(),
+                "preferred_targets": preferences,
+                "user_profile": user_profile or {
+                    "username": None,
+                    "first_name": None,
+                    "last_name": None,
                 }
+            }
 
-                # Insert new user
-                profile = analytics["user_profile"]
-                conn.execute("""
-                    INSERT OR IGNORE INTO users (id, username, first_name, last_name)
-                    VALUES (?, ?, ?, ?)
-                """, (user_id, profile["username"], profile["first_name"], profile["last_name"]))
-
-                # Insert default preferences only if no existing preferences
-                if not existing_preferences:
-                    for lang_code in preferences:
-                        conn.execute(
-                            "INSERT OR IGNORE INTO user_language_preferences (user_id, language_code) VALUES (?, ?)",
-                            (user_id, lang_code)
-                        )
+            # Insert new user
+            profile = analytics["user_profile"]
+            conn.execute("""
+                INSERT OR IGNORE INTO users (id, username, first_name, last_name, last_activity)
+                VALUES (?, ?, ?, ?, ?)
+            """, (user_id, profile["username"], profile["first_name"], profile["last_name"],
+                  int(analytics["last_activity"].timestamp())))
+
+            # Insert default preferences only if no existing preferences
+            if not existing_preferences:
+                conn.executemany(
+                    _SQL_INSERT_PREFERENCE,
+                    [(user_id, lang_code) for lang_code in preferences]
+                )
 
-                conn.commit()
-                return analytics
+            conn.commit()
+            return analytics
         finally:
-            conn.close()
+            self._release_connection(conn)
 
     async def add_vietnamese_to_existing_users(self):
         """Add Vietnamese to all existing users' preferences"""
-        await asyncio.get_event_loop().run_in_executor(
-            None, self._add_vietnamese_to_existing_users_sync
+        await asyncio.get_running_loop().run_in_executor(
+            self._executor, self._add_vietnamese_to_existing_users_sync
         )
 
     def _add_vietnamese_to_existing_users_sync(self):
         """Synchronous version of add_vietnamese_to_existing_users"""
-        conn = self._get_connection()
+        conn = self._acquire_connection()
         try:
-            # Get all users who don't have Vietnamese in their preferences
+            # Users that already have Vietnamese are skipped by the primary key
             cursor = conn.execute("""
-                SELECT DISTINCT id as user_id
-                FROM users
-                WHERE id NOT IN (
-                    SELECT user_id
-                    FROM user_language_preferences
-                    WHERE language_code = 'vi'
-                )
+                INSERT OR IGNORE INTO user_language_preferences (user_id, language_code)
+                SELECT id, 'vi' FROM users
             """)
-            users_without_vi = [row["user_id"] for row in cursor.fetchall()]
-
-            # Add Vietnamese to their preferences
-            for user_id in users_without_vi:
-                conn.execute(
-                    "INSERT OR IGNORE INTO user_language_preferences (user_id, language_code) VALUES (?, ?)",
-                    (user_id, "vi")
-                )
 
             conn.commit()
-            logger.info(f"Added Vietnamese to {len(users_without_vi)} existing users")
+            logger.info(f"Added Vietnamese to {cursor.rowcount} existing users")
 
         except Exception as e:
             logger.error(f"Error adding Vietnamese to users: {e}")
             conn.rollback()
         finally:
-            conn.close()
+            self._release_connection(conn)
 
     async def update_user_analytics(self, user_id: int, analytics: Dict):
         """Update user analytics in database"""
-        await asyncio.get_event_loop().run_in_executor(
-            None, self._update_user_analytics_sync, user_id, analytics
+        await asyncio.get_running_loop().run_in_executor(
+            self._executor, self._update_user_analytics_sync, user_id, analytics
         )
 
     def _update_user_analytics_sync(self, user_id: int, analytics: Dict):
         """Synchronous version of update_user_analytics"""
-        conn = self._get_connection()
+        conn = self._acquire_connection()
         try:
             profile = analytics["user_profile"]
             conn.execute("""
@@ -387,55 +482,52 @@ class DatabaseManager:
                 analytics["voice_replies_enabled"],
                 analytics["message_count"],
                 analytics["voice_responses_sent"],
-                analytics["last_activity"].isoformat(),
+                int(analytics["last_activity"].timestamp()),
                 user_id
             ))
 
             # Update preferences if provided
             if "preferred_targets" in analytics:
-                conn.execute(
-                    "DELETE FROM user_language_preferences WHERE user_id = ?",
-                    (user_id,)
-                )
-                for lang_code in analytics["preferred_targets"]:
-                    conn.execute(
-                        "INSERT OR IGNORE INTO user_language_preferences (user_id, language_code) VALUES (?, ?)",
-                        (user_id, lang_code)
-                    )
+                self._replace_preferences(conn, user_id, analytics["preferred_targets"])
 
             conn.commit()
         finally:
-            conn.close()
+            self._release_connection(conn)
 
     async def get_all_users(self) -> List[Dict]:
         """Get all users with their analytics data"""
-        return await asyncio.get_event_loop().run_in_executor(
-            None, self._get_all_users_sync
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, self._get_all_users_sync
         )
 
     def _get_all_users_sync(self) -> List[Dict]:
         """Synchronous version of get_all_users"""
-        conn = self._get_connection()
+        conn = self._acquire_connection()
         try:
             cursor = conn.execute("""
-                SELECT u.*, GROUP_CONCAT(ulp.language_code) as preferences
+                SELECT u.*,
+                       json_group_array(ulp.language_code)
+                           FILTER (WHERE ulp.language_code IS NOT NULL) AS preferences
                 FROM users u
                 LEFT JOIN user_language_preferences ulp ON u.id = ulp.user_id
                 GROUP BY u.id
                 ORDER BY u.last_activity DESC
             """)
 
+            # Iterate the cursor directly instead of materializing fetchall()
+            parse_ts = datetime.fromisoformat
+            loads = json.loads
             users = []
-            for row in cursor.fetchall():
-                preferences = set(row["preferences"].split(",")) if row["preferences"] else set()
+            for row in cursor:
+                preferences = frozenset(loads(row["preferences"]))
                 user_data = {
                     "user_id": row["id"],
                     "is_disabled": bool(row["is_disabled"]),
                     "voice_replies_enabled": bool(row["voice_replies_enabled"]),
                     "message_count": row["message_count"],
                     "voice_responses_sent": row["voice_responses_sent"],
-                    "last_activity": datetime.fromisoformat(row["last_activity"]) if row["last_activity"] else datetime.now(),
-                    "created_at": datetime.fromisoformat(row["created_at"]) if row["created_at"] else datetime.now(),
+                    "last_activity": datetime.fromtimestamp(row["last_activity"]) if row["last_activity"] else datetime.now(),
+                    "created_at": parse_ts(row["created_at"]) if row["created_at"] else datetime.now(),
                     "user_profile": {
                         "username": row["username"],
                         "first_name": row["first_name"],
@@ -446,70 +538,72 @@ class DatabaseManager:
                 users.append(user_data)
             return users
         finally:
-            conn.close()
+            self._release_connection(conn)
 
     async def get_all_users_summary(self) -> Dict:
         """Get summary of all users for admin dashboard"""
-        return await asyncio.get_event_loop().run_in_executor(
-            None, self._get_all_users_summary_sync
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, self._get_all_users_summary_sync
         )
 
     def _get_all_users_summary_sync(self) -> Dict:
         """Synchronous version of get_all_users_summary"""
-        conn = self._get_connection()
+        conn = self._acquire_connection()
         try:
             cursor = conn.execute("""
-                SELECT u.*, GROUP_CONCAT(ulp.language_code) as preferences
+                SELECT u.*,
+                       json_group_array(ulp.language_code)
+                           FILTER (WHERE ulp.language_code IS NOT NULL) AS preferences
                 FROM users u
                 LEFT JOIN user_language_preferences ulp ON u.id = ulp.user_id
                 GROUP BY u.id
                 ORDER BY u.last_activity DESC
             """)
 
-            users = {}
-            for row in cursor.fetchall():
-                preferences = set(row["preferences"].split(",")) if row["preferences"] else set()
-                users[row["id"]] = {
+            # Stream rows from the cursor instead of materializing fetchall()
+            loads = json.loads
+            return {
+                row["id"]: {
                     "is_disabled": bool(row["is_disabled"]),
                     "voice_replies_enabled": bool(row["voice_replies_enabled"]),
                     "message_count": row["message_count"],
                     "voice_responses_sent": row["voice_responses_sent"],
-                    "last_activity": datetime.fromisoformat(row["last_activity"]),
-                    "preferred_targets": preferences,
+                    "last_activity": datetime.fromtimestamp(row["last_activity"]) if row["last_activity"] else datetime.now(),
+                    "preferred_targets": frozenset(loads(row["preferences"])),
                     "user_profile": {
                         "username": row["username"],
                         "first_name": row["first_name"],
                         "last_name": row["last_name"],
                     }
                 }
-
-            return users
+                for row in cursor
+            }
         finally:
-            conn.close()
+            self._release_connection(conn)
 
     # Atomic operations for analytics to prevent race conditions
     async def increment_message_count(self, user_id: int, user_profile: Optional[Dict] = None):
         """Atomically increment user message count and update last activity"""
-        await asyncio.get_event_loop().run_in_executor(
-            None, self._increment_message_count_sync, user_id, user_profile
+        await asyncio.get_running_loop().run_in_executor(
+            self._executor, self._increment_message_count_sync, user_id, user_profile
         )
 
     def _increment_message_count_sync(self, user_id: int, user_profile: Optional[Dict] = None):
         """Synchronous version of increment_message_count"""
-        conn = self._get_connection()
+        conn = self._acquire_connection()
         try:
             # Ensure user exists first
             profile = user_profile or {"username": None, "first_name": None, "last_name": None}
             conn.execute("""
-                INSERT OR IGNORE INTO users (id, username, first_name, last_name)
-                VALUES (?, ?, ?, ?)
+                INSERT OR IGNORE INTO users (id, username, first_name, last_name, last_activity)
+                VALUES (?, ?, ?, ?, CAST(strftime('%s', 'now') AS INTEGER))
             """, (user_id, profile["username"], profile["first_name"], profile["last_name"]))
 
             # Atomically increment message count and update last activity
             conn.execute("""
                 UPDATE users SET
                     message_count = message_count + 1,
-                    last_activity = CURRENT_TIMESTAMP,
+                    last_activity = CAST(strftime('%s', 'now') AS INTEGER),
                     username = COALESCE(?, username),
                     first_name = COALESCE(?, first_name),
                     last_name = COALESCE(?, last_name)
@@ -518,22 +612,59 @@ class DatabaseManager:
 
             conn.commit()
         finally:
-            conn.close()
+            self._release_connection(conn)
+
+    async def increment_activity_counts(self, entries: List[tuple]):
+        """Apply a batch of (user_id, messages, voice_responses, user_profile) updates in one transaction"""
+        await asyncio.get_running_loop().run_in_executor(
+            self._executor, self._increment_activity_counts_sync, entries
+        )
+
+    def _increment_activity_counts_sync(self, entries: List[tuple]):
+        """Synchronous version of increment_activity_counts"""
+        empty_profile = {"username": None, "first_name": None, "last_name": None}
+        rows = []
+        for user_id, messages, voice_responses, user_profile in entries:
+            profile = user_profile or empty_profile
+            rows.append((user_id, messages, voice_responses,
+                         profile["username"], profile["first_name"], profile["last_name"]))
+
+        conn = self._acquire_connection()
+        try:
+            # Ensure users exist first
+            conn.executemany("""
+                INSERT OR IGNORE INTO users (id, username, first_name, last_name, last_activity)
+                VALUES (?, ?, ?, ?, CAST(strftime('%s', 'now') AS INTEGER))
+            """, [(r[0], r[3], r[4], r[5]) for r in rows])
+
+            # Atomically add counts; only messages count as user activity
+            conn.executemany("""
+                UPDATE users SET
+                    message_count = message_count + ?,
+                    voice_responses_sent = voice_responses_sent + ?,
+                    last_activity = CASE WHEN ? > 0 THEN CAST(strftime('%s', 'now') AS INTEGER) ELSE last_activity END,
+                    username = COALESCE(?, username),
+                    first_name = COALESCE(?, first_name),
+                    last_name = COALESCE(?, last_name)
+                WHERE id = ?
+            """, [(r[1], r[2], r[1], r[3], r[4], r[5], r[0]) for r in rows])
+
+            conn.commit()
+        finally:
+            self._release_connection(conn)
 
     async def increment_voice_responses(self, user_id: int):
         """Atomically increment voice response counter"""
-        await asyncio.get_event_loop().run_in_executor(
-            None, self._increment_voice_responses_sync, user_id
+        await asyncio.get_running_loop().run_in_executor(
+            self._executor, self._increment_voice_responses_sync, user_id
         )
 
     def _increment_voice_responses_sync(self, user_id: int):
         """Synchronous version of increment_voice_responses"""
-        conn = self._get_connection()
+        conn = self._acquire_connection()
         try:
             # Ensure user exists first
-            conn.execute("""
-                INSERT OR IGNORE INTO users (id) VALUES (?)
-            """, (user_id,))
+            conn.execute(_SQL_ENSURE_USER, (user_id,))
 
             # Atomically increment voice responses counter
             conn.execute("""
@@ -543,22 +674,20 @@ class DatabaseManager:
 
             conn.commit()
         finally:
-            conn.close()
+            self._release_connection(conn)
 
     async def toggle_user_disabled(self, user_id: int) -> bool:
         """Atomically toggle user disabled status"""
-        return await asyncio.get_event_loop().run_in_executor(
-            None, self._toggle_user_disabled_sync, user_id
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, self._toggle_user_disabled_sync, user_id
         )
 
     def _toggle_user_disabled_sync(self, user_id: int) -> bool:
         """Synchronous version of toggle_user_disabled"""
-        conn = self._get_connection()
+        conn = self._acquire_connection()
         try:
             # Ensure user exists first
-            conn.execute("""
-                INSERT OR IGNORE INTO users (id) VALUES (?)
-            """, (user_id,))
+            conn.execute(_SQL_ENSURE_USER, (user_id,))
 
             # Get current disabled status and toggle it
             cursor = conn.execute("""
@@ -576,47 +705,43 @@ class DatabaseManager:
             conn.commit()
             return not new_disabled  # Return enabled status
         finally:
-            conn.close()
+            self._release_connection(conn)
 
     async def set_user_disabled(self, user_id: int, disabled: bool) -> bool:
-        """Atomically set user disabled status"""
-        return await asyncio.get_event_loop().run_in_executor(
-            None, self._set_user_disabled_sync, user_id, disabled
+        """Atomically set user disabled status; returns True if it was stored"""
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, self._set_user_disabled_sync, user_id, disabled
         )
 
     def _set_user_disabled_sync(self, user_id: int, disabled: bool) -> bool:
         """Synchronous version of set_user_disabled"""
-        conn = self._get_connection()
+        conn = self._acquire_connection()
         try:
             # Ensure user exists first
-            conn.execute("""
-                INSERT OR IGNORE INTO users (id) VALUES (?)
-            """, (user_id,))
+            conn.execute(_SQL_ENSURE_USER, (user_id,))
 
             # Atomically set disabled status
-            conn.execute("""
+            cursor = conn.execute("""
                 UPDATE users SET is_disabled = ? WHERE id = ?
             """, (disabled, user_id))
 
             conn.commit()
-            return not disabled  # Return enabled status
+            return cursor.rowcount > 0  # Whether the status was stored
         finally:
-            conn.close()
+            self._release_connection(conn)
 
     async def toggle_voice_replies(self, user_id: int) -> bool:
         """Atomically toggle voice replies preference"""
-        return await asyncio.get_event_loop().run_in_executor(
-            None, self._toggle_voice_replies_sync, user_id
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, self._toggle_voice_replies_sync, user_id
         )
 
     def _toggle_voice_replies_sync(self, user_id: int) -> bool:
         """Synchronous version of toggle_voice_replies"""
-        conn = self._get_connection()
+        conn = self._acquire_connection()
         try:
             # Ensure user exists first
-            conn.execute("""
-                INSERT OR IGNORE INTO users (id) VALUES (?)
-            """, (user_id,))
+            conn.execute(_SQL_ENSURE_USER, (user_id,))
 
             # Get current voice replies status and toggle it
             cursor = conn.execute("""
@@ -634,22 +759,20 @@ class DatabaseManager:
             conn.commit()
             return new_enabled
         finally:
-            conn.close()
+            self._release_connection(conn)
 
     async def toggle_language_preference(self, user_id: int, lang_code: str) -> Set[str]:
         """Atomically toggle language preference and return current preferences"""
-        return await asyncio.get_event_loop().run_in_executor(
-            None, self._toggle_language_preference_sync, user_id, lang_code
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, self._toggle_language_preference_sync, user_id, lang_code
         )
 
     def _toggle_language_preference_sync(self, user_id: int, lang_code: str) -> Set[str]:
         """Synchronous version of toggle_language_preference"""
-        conn = self._get_connection()
+        conn = self._acquire_connection()
         try:
             # Ensure user exists first
-            conn.execute("""
-                INSERT OR IGNORE INTO users (id) VALUES (?)
-            """, (user_id,))
+            conn.execute(_SQL_ENSURE_USER, (user_id,))
 
             # Check if preference exists
             cursor = conn.execute("""
@@ -664,38 +787,31 @@ class DatabaseManager:
                 """, (user_id, lang_code))
             else:
                 # Add preference
-                conn.execute("""
-                    INSERT OR IGNORE INTO user_language_preferences (user_id, language_code) VALUES (?, ?)
-                """, (user_id, lang_code))
+                conn.execute(_SQL_INSERT_PREFERENCE, (user_id, lang_code))
 
             # Get current preferences
-            cursor = conn.execute("""
-                SELECT language_code FROM user_language_preferences WHERE user_id = ?
-            """, (user_id,))
+            cursor = conn.execute(_SQL_SELECT_PREFERENCES, (user_id,))
             current_prefs = {row["language_code"] for row in cursor.fetchall()}
 
             # If no preferences left, restore default languages
             if not current_prefs:
-                for lang in DEFAULT_LANGUAGES:
-                    conn.execute("""
-                        INSERT OR IGNORE INTO user_language_preferences (user_id, language_code) VALUES (?, ?)
-                    """, (user_id, lang))
+                conn.executemany(_SQL_INSERT_PREFERENCE, [(user_id, lang) for lang in DEFAULT_LANGUAGES])
                 current_prefs = DEFAULT_LANGUAGES
 
             conn.commit()
             return current_prefs
         finally:
-            conn.close()
+            self._release_connection(conn)
 
     async def delete_inactive_users(self, days: int = 3) -> int:
         """Delete users inactive for more than specified days"""
-        return await asyncio.get_event_loop().run_in_executor(
-            None, self._delete_inactive_users_sync, days
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, self._delete_inactive_users_sync, days
         )
 
     def _delete_inactive_users_sync(self, days: int) -> int:
         """Synchronous version of delete_inactive_users"""
-        conn = self._get_connection()
+        conn = self._acquire_connection()
         try:
             from datetime import datetime, timedelta
             threshold = datetime.now() - timedelta(days=days)
@@ -704,12 +820,12 @@ class DatabaseManager:
             cursor = conn.execute("""
                 SELECT COUNT(*) as count FROM users
                 WHERE last_activity < ?
-            """, (threshold.isoformat(),))
+            """, (int(threshold.timestamp()),))
             count = cursor.fetchone()["count"]
 
             # Delete all related records first (foreign key constraints)
             inactive_subquery = "SELECT id FROM users WHERE last_activity < ?"
-            threshold_param = (threshold.isoformat(),)
+            threshold_param = (int(threshold.timestamp()),)
 
             for table in [
                 "user_language_preferences",
@@ -738,12 +854,12 @@ class DatabaseManager:
             logger.info(f"Deleted {count} inactive users (>{days} days)")
             return count
         finally:
-            conn.close()
+            self._release_connection(conn)
 
     async def clear_tts_cache(self, days: int = 3) -> tuple[int, float]:
         """Clear TTS cache files older than specified days"""
-        return await asyncio.get_event_loop().run_in_executor(
-            None, self._clear_tts_cache_sync, days
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, self._clear_tts_cache_sync, days
         )
 
     def _clear_tts_cache_sync(self, days: int) -> tuple[int, float]:
@@ -778,8 +894,8 @@ class DatabaseManager:
 
     async def create_room(self, creator_id: int, language_code: str, name: Optional[str] = None) -> str:
         """Create a new room and return room code"""
-        return await asyncio.get_event_loop().run_in_executor(
-            None, self._create_room_sync, creator_id, language_code, name
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, self._create_room_sync, creator_id, language_code, name
         )
 
     def _create_room_sync(self, creator_id: int, language_code: str, name: Optional[str]) -> str:
@@ -787,7 +903,7 @@ class DatabaseManager:
         import random, string
         from datetime import timedelta
 
-        conn = self._get_connection()
+        conn = self._acquire_connection()
         try:
             # Generate unique room code
             while True:
@@ -817,48 +933,69 @@ class DatabaseManager:
             return code
 
         finally:
-            conn.close()
+            self._release_connection(conn)
 
     async def get_room_by_code(self, code: str) -> Optional[Dict]:
         """Get room by code"""
-        return await asyncio.get_event_loop().run_in_executor(
-            None, self._get_room_by_code_sync, code
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, self._get_room_by_code_sync, code
         )
 
     def _get_room_by_code_sync(self, code: str) -> Optional[Dict]:
         """Synchronous version of get_room_by_code"""
-        conn = self._get_connection()
+        conn = self._acquire_connection()
         try:
-            cursor = conn.execute("""
-                SELECT * FROM rooms WHERE code = ? AND status = 'active'
-            """, (code,))
-            row = cursor.fetchone()
-
-            if not row:
-                return None
+            return self._fetch_room_by_code(conn, code)
+        finally:
+            self._release_connection(conn)
+
+    def _fetch_room_by_code(self, conn: sqlite3.Connection, code: str) -> Optional[Dict]:
+        """Fetch active room by code using an open connection"""
+        cursor = conn.execute("""
+            SELECT * FROM rooms WHERE code = ? AND status = 'active'
+        """, (code,))
+        row = cursor.fetchone()
+
+        if not row:
+            return None
+
+        return {
+            "id": row["id"],
+            "code": row["code"],
+            "creator_id": row["creator_id"],
+            "name": row["name"],
+            "status": row["status"],
+            "max_members": row["max_members"],
+            "created_at": datetime.fromisoformat(row["created_at"]),
+            "expires_at": datetime.fromisoformat(row["expires_at"]) if row["expires_at"] else None
+        }
+
+    async def get_room_and_active(self, user_id: int, code: str) -> tuple[Optional[Dict], Optional[Dict]]:
+        """Get room by code and the user's current active room in one call"""
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, self._get_room_and_active_sync, user_id, code
+        )
 
-            return {
-                "id": row["id"],
-                "code": row["code"],
-                "creator_id": row["creator_id"],
-                "name": row["name"],
-                "status": row["status"],
-                "max_members": row["max_members"],
-                "created_at": datetime.fromisoformat(row["created_at"]),
-                "expires_at": datetime.fromisoformat(row["expires_at"]) if row["expires_at"] else None
-            }
+    def _get_room_and_active_sync(self, user_id: int, code: str) -> tuple[Optional[Dict], Optional[Dict]]:
+        """Synchronous version of get_room_and_active"""
+        conn = self._acquire_connection()
+        try:
+            return (
+                self._fetch_room_by_code(conn, code),
+                self._fetch_user_active_room(conn, user_id),
+            )
         finally:
-            conn.close()
+            self._release_connection(conn)
 
     async def join_room(self, room_id: int, user_id: int, language_code: str) -> bool:
         """Join room as member"""
-        return await asyncio.get_event_loop().run_in_executor(
-            None, self._join_room_sync, room_id, user_id, language_code
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, self._join_room_sync, room_id, user_id, language_code
         )
 
     def _join_room_sync(self, room_id: int, user_id: int, language_code: str) -> bool:
         """Synchronous version of join_room"""
-        conn = self._get_connection()
+        conn = self._acquire_connection()
         try:
             # Check if room is full
             cursor = conn.execute("""
@@ -886,17 +1023,17 @@ class DatabaseManager:
             logger.error(f"Error joining room: {e}")
             return False
         finally:
-            conn.close()
+            self._release_connection(conn)
 
     async def leave_room(self, room_id: int, user_id: int) -> bool:
         """Leave room"""
-        return await asyncio.get_event_loop().run_in_executor(
-            None, self._leave_room_sync, room_id, user_id
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, self._leave_room_sync, room_id, user_id
         )
 
     def _leave_room_sync(self, room_id: int, user_id: int) -> bool:
         """Synchronous version of leave_room"""
-        conn = self._get_connection()
+        conn = self._acquire_connection()
         try:
             conn.execute("""
                 DELETE FROM room_members WHERE room_id = ? AND user_id = ?
@@ -920,17 +1057,34 @@ class DatabaseManager:
             logger.error(f"Error leaving room: {e}")
             return False
         finally:
-            conn.close()
+            self._release_connection(conn)
+
+    async def get_room_creator(self, room_id: int) -> Optional[int]:
+        """Get the creator user ID of a room"""
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, self._get_room_creator_sync, room_id
+        )
+
+    def _get_room_creator_sync(self, room_id: int) -> Optional[int]:
+        """Synchronous version of get_room_creator"""
+        conn = self._acquire_connection()
+        try:
+            row = conn.execute(
+                "SELECT creator_id FROM rooms WHERE id = ?", (room_id,)
+            ).fetchone()
+            return row["creator_id"] if row else None
+        finally:
+            self._release_connection(conn)
 
     async def get_room_members(self, room_id: int) -> List[Dict]:
         """Get all members of a room"""
-        return await asyncio.get_event_loop().run_in_executor(
-            None, self._get_room_members_sync, room_id
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, self._get_room_members_sync, room_id
         )
 
     def _get_room_members_sync(self, room_id: int) -> List[Dict]:
         """Synchronous version of get_room_members"""
-        conn = self._get_connection()
+        conn = self._acquire_connection()
         try:
             cursor = conn.execute("""
                 SELECT rm.*, u.username, u.first_name, u.last_name
@@ -957,54 +1111,91 @@ class DatabaseManager:
 
             return members
         finally:
-            conn.close()
+            self._release_connection(conn)
+
+    async def get_room_members_formatted(self, room_id: int) -> List[tuple]:
+        """Get (role_icon, flag, display_name) rows for all members of a room"""
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, self._get_room_members_formatted_sync, room_id
+        )
+
+    def _get_room_members_formatted_sync(self, room_id: int) -> List[tuple]:
+        """Synchronous version of get_room_members_formatted"""
+        conn = self._acquire_connection()
+        try:
+            cursor = conn.execute(f"""
+                SELECT
+                    CASE WHEN rm.role = 'creator' THEN '👑' ELSE '👤' END AS role_icon,
+                    {_MEMBER_FLAG_SQL} AS flag,
+                    CASE
+                        WHEN u.username IS NOT NULL AND u.username != '' THEN '@' || u.username
+                        WHEN u.first_name IS NOT NULL AND u.first_name != '' THEN
+                            u.first_name || COALESCE(NULLIF(' ' || u.last_name, ' '), '')
+                        ELSE 'User ' || rm.user_id
+                    END AS display_name
+                FROM room_members rm
+                JOIN users u ON rm.user_id = u.id
+                WHERE rm.room_id = ?
+                ORDER BY rm.joined_at
+            """, (room_id,))
+
+            return [
+                (row["role_icon"], row["flag"], row["display_name"])
+                for row in cursor.fetchall()
+            ]
+        finally:
+            self._release_connection(conn)
 
     async def get_user_active_room(self, user_id: int) -> Optional[Dict]:
         """Get user's active room if any"""
-        return await asyncio.get_event_loop().run_in_executor(
-            None, self._get_user_active_room_sync, user_id
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, self._get_user_active_room_sync, user_id
         )
 
     def _get_user_active_room_sync(self, user_id: int) -> Optional[Dict]:
         """Synchronous version of get_user_active_room"""
-        conn = self._get_connection()
+        conn = self._acquire_connection()
         try:
-            cursor = conn.execute("""
-                SELECT r.*, rm.language_code, rm.role
-                FROM rooms r
-                JOIN room_members rm ON r.id = rm.room_id
-                WHERE rm.user_id = ? AND r.status = 'active'
-                LIMIT 1
-            """, (user_id,))
-
-            row = cursor.fetchone()
-            if not row:
-                return None
-
-            return {
-                "id": row["id"],
-                "code": row["code"],
-                "creator_id": row["creator_id"],
-                "name": row["name"],
-                "status": row["status"],
-                "max_members": row["max_members"],
-                "created_at": datetime.fromisoformat(row["created_at"]),
-                "expires_at": datetime.fromisoformat(row["expires_at"]) if row["expires_at"] else None,
-                "user_language": row["language_code"],
-                "user_role": row["role"]
-            }
+            return self._fetch_user_active_room(conn, user_id)
         finally:
-            conn.close()
+            self._release_connection(conn)
+
+    def _fetch_user_active_room(self, conn: sqlite3.Connection, user_id: int) -> Optional[Dict]:
+        """Fetch user's active room using an open connection"""
+        cursor = conn.execute("""
+            SELECT r.*, rm.language_code, rm.role
+            FROM rooms r
+            JOIN room_members rm ON r.id = rm.room_id
+            WHERE rm.user_id = ? AND r.status = 'active'
+            LIMIT 1
+        """, (user_id,))
+
+        row = cursor.fetchone()
+        if not row:
+            return None
+
+        return {
+            "id": row["id"],
+            "code": row["code"],
+            "creator_id": row["creator_id"],
+            "name": row["name"],
+            "status": row["status"],
+            "max_members": row["max_members"],
+            "created_at": datetime.fromisoformat(row["created_at"]),
+            "expires_at": datetime.fromisoformat(row["expires_at"]) if row["expires_at"] else None,
+            "user_language": row["language_code"],
+            "user_role": row["role"]
+        }
 
     async def close_room(self, room_id: int) -> bool:
         """Close room"""
-        return await asyncio.get_event_loop().run_in_executor(
-            None, self._close_room_sync, room_id
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, self._close_room_sync, room_id
         )
 
     def _close_room_sync(self, room_id: int) -> bool:
         """Synchronous version of close_room"""
-        conn = self._get_connection()
+        conn = self._acquire_connection()
         try:
             conn.execute("""
                 UPDATE rooms SET status = 'closed' WHERE id = ?
@@ -1016,17 +1207,17 @@ class DatabaseManager:
             logger.error(f"Error closing room: {e}")
             return False
         finally:
-            conn.close()
+            self._release_connection(conn)
 
     async def save_room_message(self, room_id: int, user_id: int, text: str, language_code: str) -> bool:
         """Save room message to history"""
-        return await asyncio.get_event_loop().run_in_executor(
-            None, self._save_room_message_sync, room_id, user_id, text, language_code
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, self._save_room_message_sync, room_id, user_id, text, language_code
         )
 
     def _save_room_message_sync(self, room_id: int, user_id: int, text: str, language_code: str) -> bool:
         """Synchronous version of save_room_message"""
-        conn = self._get_connection()
+        conn = self._acquire_connection()
         try:
             conn.execute("""
                 INSERT INTO room_messages (room_id, user_id, message_text, language_code)
@@ -1038,17 +1229,17 @@ class DatabaseManager:
             logger.error(f"Error saving room message: {e}")
             return False
         finally:
-            conn.close()
+            self._release_connection(conn)
 
     async def delete_expired_rooms(self, hours: int = 24) -> int:
         """Delete expired rooms"""
-        return await asyncio.get_event_loop().run_in_executor(
-            None, self._delete_expired_rooms_sync, hours
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, self._delete_expired_rooms_sync, hours
         )
 
     def _delete_expired_rooms_sync(self, hours: int) -> int:
         """Synchronous version of delete_expired_rooms"""
-        conn = self._get_connection()
+        conn = self._acquire_connection()
         try:
             now = datetime.now().isoformat()
 
@@ -1069,19 +1260,19 @@ class DatabaseManager:
             logger.info(f"Closed {count} expired rooms")
             return count
         finally:
-            conn.close()
+            self._release_connection(conn)
 
     # ==================== CONTEXT MEMORY ====================
 
     async def save_user_message(self, user_id: int, text: str, source_lang: str, target_langs: Optional[str] = None):
         """Save user message for context memory"""
-        await asyncio.get_event_loop().run_in_executor(
-            None, self._save_user_message_sync, user_id, text, source_lang, target_langs
+        await asyncio.get_running_loop().run_in_executor(
+            self._executor, self._save_user_message_sync, user_id, text, source_lang, target_langs
         )
 
     def _save_user_message_sync(self, user_id: int, text: str, source_lang: str, target_langs: Optional[str]):
         """Synchronous version of save_user_message"""
-        conn = self._get_connection()
+        conn = self._acquire_connection()
         try:
             conn.execute("""
                 INSERT INTO user_messages (user_id, message_text, source_language, target_languages)
@@ -1091,17 +1282,17 @@ class DatabaseManager:
         except Exception as e:
             logger.error(f"Error saving user message: {e}")
         finally:
-            conn.close()
+            self._release_connection(conn)
 
     async def get_user_context(self, user_id: int, limit: int = 3) -> List[Dict]:
         """Get user's recent messages for context"""
-        return await asyncio.get_event_loop().run_in_executor(
-            None, self._get_user_context_sync, user_id, limit
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, self._get_user_context_sync, user_id, limit
         )
 
     def _get_user_context_sync(self, user_id: int, limit: int) -> List[Dict]:
         """Synchronous version of get_user_context"""
-        conn = self._get_connection()
+        conn = self._acquire_connection()
         try:
             cursor = conn.execute("""
                 SELECT message_text, source_language, created_at
@@ -1122,17 +1313,17 @@ class DatabaseManager:
             # Return in chronological order (oldest first)
             return list(reversed(messages))
         finally:
-            conn.close()
+            self._release_connection(conn)
 
     async def get_user_stats(self, user_id: int) -> Dict:
         """Get comprehensive user statistics for /stats command"""
-        return await asyncio.get_event_loop().run_in_executor(
-            None, self._get_user_stats_sync, user_id
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, self._get_user_stats_sync, user_id
         )
 
     def _get_user_stats_sync(self, user_id: int) -> Dict:
         """Synchronous version of get_user_stats"""
-        conn = self._get_connection()
+        conn = self._acquire_connection()
         try:
             # Get user basic info
             cursor = conn.execute("""
@@ -1181,13 +1372,13 @@ class DatabaseManager:
                 "voice_responses_sent": user_row["voice_responses_sent"],
                 "voice_replies_enabled": bool(user_row["voice_replies_enabled"]),
                 "created_at": datetime.fromisoformat(user_row["created_at"]) if user_row["created_at"] else None,
-                "last_activity": datetime.fromisoformat(user_row["last_activity"]) if user_row["last_activity"] else None,
+                "last_activity": datetime.fromtimestamp(user_row["last_activity"]) if user_row["last_activity"] else None,
                 "top_languages": top_languages,
                 "week_messages": week_messages,
                 "total_context_messages": total_context_messages
             }
         finally:
-            conn.close()
+            self._release_connection(conn)
 
     # ==================== TRANSLATION FEEDBACK ====================
 
@@ -1215,8 +1406,8 @@ class DatabaseManager:
         Returns:
             True if saved successfully
         """
-        return await asyncio.get_event_loop().run_in_executor(
-            None, self._save_translation_feedback_sync,
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, self._save_translation_feedback_sync,
             user_id, source_text, source_lang, target_lang, translated_text, feedback_type, suggestion
         )
 
@@ -1231,7 +1422,7 @@ class DatabaseManager:
         suggestion: Optional[str]
     ) -> bool:
         """Synchronous version of save_translation_feedback"""
-        conn = self._get_connection()
+        conn = self._acquire_connection()
         try:
             conn.execute("""
                 INSERT INTO translation_feedback
@@ -1246,5 +1437,5 @@ class DatabaseManager:
             conn.rollback()
             return False
         finally:
-            conn.close()
+            self._release_connection(conn)
 
@@ -1,6 +1,7 @@
 """
 Text formatting utilities
 """
+import asyncio
 import subprocess
 import psutil
 import os
@@ -8,18 +9,19 @@ import time
 from datetime import datetime, timedelta
 
 
+# Translation table mapping each markdown metacharacter to its escaped form
+_MD_ESCAPE_TABLE = str.maketrans({char: f'\\{char}' for char in '_*`[]()~>#+-=|{}.!'})
+
+
 def escape_markdown(text: str) -> str:
     """Escape special markdown characters"""
-    special_chars = ['_', '*', '`', '[', ']', '(', ')', '~', '>', '#', '+', '-', '=', '|', '{', '}', '.', '!']
-    for char in special_chars:
-        text = text.replace(char, f'\\{char}')
-    return text
+    return text.translate(_MD_ESCAPE_TABLE)
 
 
 async def format_admin_dashboard() -> str:
     """Format admin dashboard main screen with statistics"""
     from ..core.app import db
-    from ..services.model_manager import get_model_manager
+    from ..services.model_manager import get_model_manager, get_model_info
     from datetime import datetime, timedelta
 
     all_users = await db.get_all_users()
@@ -35,9 +37,8 @@ async def format_admin_dashboard() -> str:
     inactive_users = sum(1 for u in all_users if u["last_activity"] < seven_days_ago)
 
     # Get current model info
-    model_manager = get_model_manager()
-    current_model = model_manager.get_current_model()
-    model_info = model_manager.get_model_info(current_model)
+    current_model = get_model_manager().get_current_model()
+    model_info = get_model_info(current_model)
     model_icon = model_info.get('icon', '🤖')
     model_name = model_info.get('name', current_model)
 
@@ -85,6 +86,12 @@ async def format_users_list() -> str:
 
 async def format_server_status() -> str:
     """Format server status information for admin dashboard"""
+    # systemctl calls and the 1s CPU sample would otherwise block the event loop
+    return await asyncio.to_thread(_format_server_status_sync)
+
+
+def _format_server_status_sync() -> str:
+    """Synchronous version of format_server_status"""
     try:
         # Bot service status
         try:
@@ -1,8 +1,12 @@
 """
 Keyboard builders for room feature
 """
+from functools import lru_cache
+
 from aiogram.types import InlineKeyboardMarkup, InlineKeyboardButton, ReplyKeyboardMarkup, KeyboardButton
 
+from ..core.constants import SUPPORTED_LANGUAGES
+
 
 def build_rooms_main_menu() -> InlineKeyboardMarkup:
     """
@@ -77,15 +81,17 @@ def build_members_list_keyboard(room) -> InlineKeyboardMarkup:
     return InlineKeyboardMarkup(inline_keyboard=keyboard)
 
 
+@lru_cache(maxsize=1)
 def build_language_selection_keyboard() -> InlineKeyboardMarkup:
     """
     Build language selection keyboard
 
+    The languages never change at runtime, so the markup is built once
+    and the same instance is reused for every room flow.
+
     Returns:
         InlineKeyboardMarkup with language options
     """
-    from ..core.constants import SUPPORTED_LANGUAGES
-
     keyboard = []
 
     # Create rows of 2 languages each
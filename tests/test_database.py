@@ -6,6 +6,7 @@ import pytest
 import tempfile
 from pathlib import Path
 from src.storage.database import DatabaseManager
+from src.core.constants import DEFAULT_LANGUAGES
 
 
 class TestDatabaseManager:
@@ -151,4 +152,68 @@ class TestDatabaseManager:
         assert 100 in summary
         assert 200 in summary
         assert summary[100]["user_profile"]["username"] == "user1"
-        assert summary[200]["user_profile"]["username"] == "user2"
\ No newline at end of file
+        assert summary[200]["user_profile"]["username"] == "user2"
+
+    @pytest.mark.asyncio
+    async def test_room_members_formatted(self, db_manager):
+        """Test member rows are formatted in SQL"""
+        await db_manager.get_user_analytics(300, {"username": "creator", "first_name": "Room", "last_name": "Owner"})
+        await db_manager.get_user_analytics(301, {"username": None, "first_name": "Jane", "last_name": None})
+
+        code = await db_manager.create_room(300, "en")
+        room = await db_manager.get_room_by_code(code)
+        await db_manager.join_room(room["id"], 301, "th")
+
+        rows = await db_manager.get_room_members_formatted(room["id"])
+
+        assert rows == [("👑", "🇺🇸", "@creator"), ("👤", "🇹🇭", "Jane")]
+
+    @pytest.mark.asyncio
+    async def test_increment_activity_counts_batch(self, db_manager):
+        """Test batched activity updates create users and add counts"""
+        await db_manager.get_user_analytics(400)
+
+        await db_manager.increment_activity_counts([
+            (400, 3, 2, {"username": "batched", "first_name": None, "last_name": None}),
+            (401, 1, 0, None),
+        ])
+
+        summary = await db_manager.get_all_users_summary()
+        assert summary[400]["message_count"] == 3
+        assert summary[400]["voice_responses_sent"] == 2
+        assert summary[400]["user_profile"]["username"] == "batched"
+        assert summary[401]["message_count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_is_user_disabled(self, db_manager):
+        """Test disabled check registers new users and reads the flag"""
+        assert await db_manager.is_user_disabled(600) is False
+        assert await db_manager.get_user_preferences(600) == DEFAULT_LANGUAGES
+
+        await db_manager.set_user_disabled(600, True)
+        assert await db_manager.is_user_disabled(600) is True
+
+    @pytest.mark.asyncio
+    async def test_get_room_creator(self, db_manager):
+        """Test room creator lookup"""
+        await db_manager.get_user_analytics(700)
+        code = await db_manager.create_room(700, "en")
+        room = await db_manager.get_room_by_code(code)
+
+        assert await db_manager.get_room_creator(room["id"]) == 700
+        assert await db_manager.get_room_creator(999999) is None
+
+    @pytest.mark.asyncio
+    async def test_get_room_and_active(self, db_manager):
+        """Test room lookup and active-room check in one call"""
+        await db_manager.get_user_analytics(500)
+        await db_manager.get_user_analytics(501)
+        code = await db_manager.create_room(500, "ru")
+
+        room, active = await db_manager.get_room_and_active(501, code)
+        assert room["code"] == code
+        assert active is None
+
+        room, active = await db_manager.get_room_and_active(500, "NOPE00")
+        assert room is None
+        assert active["code"] == code
@@ -25,6 +25,17 @@ class MockTTSResponse:
     def __init__(self, content: bytes):
         self.content = content
 
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def iter_bytes(self, chunk_size=None):
+        chunk_size = chunk_size or len(self.content)
+        for i in range(0, len(self.content), chunk_size):
+            yield self.content[i:i + chunk_size]
+
 
 class MockOpenAIClient:
     """Mock OpenAI client for offline testing"""
@@ -40,6 +51,8 @@ class MockOpenAIClient:
         # Mock audio/speech
         self.audio.speech = Mock()
         self.audio.speech.create = AsyncMock(side_effect=self._mock_tts)
+        self.audio.speech.with_streaming_response = Mock()
+        self.audio.speech.with_streaming_response.create = Mock(side_effect=self._mock_tts_audio)
 
     async def _mock_translate(self, model, messages, max_tokens=None, temperature=None):
         """Mock translation based on input language"""
@@ -101,8 +114,12 @@ class MockOpenAIClient:
                 "Russian: Тестовый перевод"
             )
 
-    async def _mock_tts(self, model, voice, input, response_format="opus"):
+    async def _mock_tts(self, model, voice, input, response_format="opus", speed=None):
         """Mock TTS with dummy audio data"""
+        return self._mock_tts_audio(model, voice, input, response_format, speed)
+
+    def _mock_tts_audio(self, model, voice, input, response_format="opus", speed=None):
+        """Mock TTS response usable both buffered and streamed"""
         # Generate dummy audio data (OGG header + some data)
         dummy_audio = b"OggS\x00\x02\x00\x00\x00\x00\x00\x00\x00\x00" + b"dummy_audio_data" * 100
         return MockTTSResponse(dummy_audio)
@@ -135,6 +152,14 @@ class MockTTSCache:
     def get(self, text):
         return None  # Always miss cache for testing
 
+    def new_part_path(self):
+        return Path(tempfile.mkdtemp()) / "part.tmp"
+
+    def set_from_path(self, text, part_path):
+        temp_path = part_path.with_name("test_tts.ogg")
+        part_path.replace(temp_path)
+        return temp_path
+
     def set(self, text, audio_data):
         from pathlib import Path
         import tempfile
@@ -329,9 +354,7 @@ class TestOfflineTranslation:
             assert audio_path.exists()
             assert audio_path.suffix == ".ogg"
             # Cleanup
-            import shutil
-            if audio_path.parent.exists():
-                shutil.rmtree(audio_path.parent, ignore_errors=True)
+            audio_path.unlink(missing_ok=True)
 
     @pytest.mark.asyncio
     async def test_translation_error_handling(self):